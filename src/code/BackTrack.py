@@ -1,4 +1,14 @@
+import os
+import json
 import time
+import multiprocessing
+from array import array
+from itertools import islice
+
+import numpy as np
+
+from solution_set import SolutionSet
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 def isSafe(mat, row, col):
     n = len(mat)
@@ -56,22 +66,66 @@ def placeQueens(row, mat, result, times, record_times, t0):
             mat[row][col] = 0
 
 
+# Recursive function to place queens using bitmasks
+#   cols  -> bit j set if column j is taken
+#   left  -> bit j set if square (row, j) is attacked along a "\" diagonal
+#   right -> bit j set if square (row, j) is attacked along a "/" diagonal
+def placeQueensBitmask(row, n, full, cols, left, right, placed, result, times, record_times, t0):
+    # base case: If all queens are placed
+    if row == n:
+        result.append([col + 1 for col in placed])    # 1-indexed like isSafe version
+
+        if record_times:
+            times.append(time.perf_counter() - t0)
+
+        return
+
+    # every free square in this row in one mask
+    free = full & ~(cols | left | right)
+    while free:
+        bit = free & -free            # lowest set bit -> left-most free column
+        free ^= bit
+        placed[row] = bit.bit_length() - 1
+        placeQueensBitmask(
+            row + 1, n, full,
+            cols | bit, ((left | bit) << 1) & full, (right | bit) >> 1,
+            placed, result, times, record_times, t0,
+        )
+
+
 # Function to find all solutions
-def backtrackingAlgo(n, record_times=False, start_time=None):
+def backtrackingAlgo(n, record_times=False, start_time=None, limit=None, order=None):
     """
     If record_times == False  -> returns [solutions]
     If record_times == True   -> returns (solutions, times)
         where times[i] is the time (sec) when solution i was found
+    ([solutions] is a SolutionSet, see solution_set.py)
+
+    Solutions come out in the same order as the isSafe/placeQueens version.
+
+    limit=k stops after the first k solutions.
+    order picks the MRV + forward-checking search instead (see iterQueensHeuristic):
+        "lex" / "middle" / "lcv" -> value order inside the chosen row
     """
-    # Initialize the board
-    mat = [[0] * n for _ in range(n)]
-    result = []
+    result = SolutionSet(n)
     times = []
 
     t0 = start_time if start_time is not None else time.perf_counter()
 
     # Place queens
-    placeQueens(0, mat, result, times, record_times, t0)
+    if order is not None:
+        for sol in islice(iterQueensHeuristic(n, order), limit):
+            result.append(sol)
+            if record_times:
+                times.append(time.perf_counter() - t0)
+    elif limit is not None:
+        for placed in islice(iterQueensStack(n), limit):
+            result.append([col + 1 for col in placed])
+            if record_times:
+                times.append(time.perf_counter() - t0)
+    else:
+        full = (1 << n) - 1
+        placeQueensBitmask(0, n, full, 0, 0, 0, [0] * n, result, times, record_times, t0)
 
     print("\nBacktracking Results:")
     print(f"Number of Queens : {n}")
@@ -79,3 +133,733 @@ def backtrackingAlgo(n, record_times=False, start_time=None):
     if record_times:
         return result, times
     return result
+
+
+# Counting version of placeQueensBitmask: no board, no solution lists.
+# stats[0] counts the queens placed (search-tree nodes).
+def countQueensBitmask(rows_left, full, cols, left, right, stats):
+    free = full & ~(cols | left | right)
+
+    # last row: every free square completes a solution
+    if rows_left == 1:
+        count = free.bit_count()
+        stats[0] += count
+        return count
+
+    count = 0
+    while free:
+        bit = free & -free
+        free ^= bit
+        stats[0] += 1
+        count += countQueensBitmask(
+            rows_left - 1, full,
+            cols | bit, ((left | bit) << 1) & full, (right | bit) >> 1, stats,
+        )
+    return count
+
+
+# Prefixes of the first `depth` rows for counting. Only first-row columns in the
+# left half are used (+ the middle one when n is odd); each prefix comes with the
+# weight of its subtree (2 = it also stands for its mirror image).
+# shallow_nodes counts every partial board above `depth`, dead ends included.
+def countPrefixTasks(n, depth):
+    if n == 0:
+        return [([], 1)], 0    # the empty board, as backtrackingAlgo(0) returns
+    full = (1 << n) - 1
+    level = [[col] for col in range((n + 1) // 2)]
+    shallow_nodes = len(level)
+    for row in range(1, min(depth, n)):
+        next_level = []
+        for prefix in level:
+            cols, left, right = prefixMasks(n, prefix)
+            free = full & ~(cols | left | right)
+            while free:
+                bit = free & -free
+                free ^= bit
+                next_level.append(prefix + [bit.bit_length() - 1])
+        level = next_level
+        shallow_nodes += len(level)
+
+    tasks = [(prefix, 1 if n % 2 and prefix[0] == n // 2 else 2) for prefix in level]
+    return tasks, shallow_nodes
+
+
+# Worker: count the solutions (and nodes) below one prefix
+def countPrefix(n, prefix):
+    if len(prefix) == n:
+        return 1, 0
+    cols, left, right = prefixMasks(n, prefix)
+    stats = [0]
+    count = countQueensBitmask(n - len(prefix), (1 << n) - 1, cols, left, right, stats)
+    return count, stats[0]
+
+
+# Checkpoint = which prefixes are finished + the counts gathered from them.
+# Starts from scratch unless resuming from an existing file.
+def loadCheckpoint(path, n, prefix_depth, shallow_nodes, resume):
+    if path is not None and resume and os.path.exists(path):
+        with open(path) as f:
+            state = json.load(f)
+        if state["n"] != n or state["prefix_depth"] != prefix_depth:
+            raise ValueError(
+                f"Checkpoint {path} is for N = {state['n']}, prefix_depth = {state['prefix_depth']}, "
+                f"not N = {n}, prefix_depth = {prefix_depth}."
+            )
+        return state
+
+    return {"n": n, "prefix_depth": prefix_depth, "done": [], "count": 0, "nodes": shallow_nodes}
+
+
+def saveCheckpoint(path, state):
+    # write + rename, so a run killed mid-write never leaves a broken file
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def printCountResults(title, n, count, nodes, elapsed):
+    print(f"\n{title} Results:")
+    print(f"Number of Queens : {n}")
+    print(f"Solutions        : {count}")
+    print(f"Nodes visited    : {nodes}")
+    print(f"Total time taken : {elapsed:.6f} seconds")
+
+
+# Function to count all solutions
+def countSolutions(n, start_time=None, prefix_depth=3,
+                   checkpoint=None, resume=False, checkpoint_every=60.0):
+    """
+    Returns (count, nodes, elapsed) without building any solution.
+    Only first-row columns in the left half are searched; their count is doubled
+    (mirror image), and the middle column is searched on its own when n is odd.
+
+    The search runs prefix by prefix (first `prefix_depth` rows). With a
+    checkpoint path, the finished prefixes and partial counts are written to it
+    at most every `checkpoint_every` seconds and at the end; resume=True picks up
+    from that file and gives the same final count and nodes.
+    """
+    t0 = start_time if start_time is not None else time.perf_counter()
+
+    tasks, shallow_nodes = countPrefixTasks(n, prefix_depth)
+    state = loadCheckpoint(checkpoint, n, prefix_depth, shallow_nodes, resume)
+    done = set(state["done"])
+
+    last_save = time.perf_counter()
+    for idx, (prefix, weight) in enumerate(tasks):
+        if idx in done:
+            continue
+        count, nodes = countPrefix(n, prefix)
+        state["count"] += weight * count
+        state["nodes"] += nodes
+        state["done"].append(idx)
+
+        if checkpoint is not None and time.perf_counter() - last_save >= checkpoint_every:
+            saveCheckpoint(checkpoint, state)
+            last_save = time.perf_counter()
+
+    if checkpoint is not None:
+        saveCheckpoint(checkpoint, state)
+
+    elapsed = time.perf_counter() - t0
+    printCountResults("Backtracking (count only)", n, state["count"], state["nodes"], elapsed)
+    return state["count"], state["nodes"], elapsed
+
+
+# Function to count all solutions on several processes (same checkpoint format)
+def countSolutionsParallel(n, workers=None, start_time=None, prefix_depth=3,
+                           checkpoint=None, resume=False, checkpoint_every=60.0):
+    t0 = start_time if start_time is not None else time.perf_counter()
+
+    tasks, shallow_nodes = countPrefixTasks(n, prefix_depth)
+    state = loadCheckpoint(checkpoint, n, prefix_depth, shallow_nodes, resume)
+    done = set(state["done"])
+
+    last_save = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {
+            pool.submit(countPrefix, n, prefix): (idx, weight)
+            for idx, (prefix, weight) in enumerate(tasks)
+            if idx not in done
+        }
+        for future in as_completed(futures):
+            idx, weight = futures[future]
+            count, nodes = future.result()
+            state["count"] += weight * count
+            state["nodes"] += nodes
+            state["done"].append(idx)
+
+            if checkpoint is not None and time.perf_counter() - last_save >= checkpoint_every:
+                saveCheckpoint(checkpoint, state)
+                last_save = time.perf_counter()
+
+    if checkpoint is not None:
+        saveCheckpoint(checkpoint, state)
+
+    elapsed = time.perf_counter() - t0
+    printCountResults("Backtracking (parallel count)", n, state["count"], state["nodes"], elapsed)
+    return state["count"], state["nodes"], elapsed
+
+
+# Generator version of placeQueensBitmask: hands out each solution as soon as it is found.
+# forbid[row], if given, is a mask of extra columns that row may not use.
+def iterQueensBitmask(row, n, full, cols, left, right, placed, forbid=None):
+    if row == n:
+        yield [col + 1 for col in placed]
+        return
+
+    free = full & ~(cols | left | right)
+    if forbid is not None:
+        free &= ~forbid[row]
+    while free:
+        bit = free & -free
+        free ^= bit
+        placed[row] = bit.bit_length() - 1
+        yield from iterQueensBitmask(
+            row + 1, n, full,
+            cols | bit, ((left | bit) << 1) & full, (right | bit) >> 1,
+            placed, forbid,
+        )
+
+
+# Iterative bitmask search with an explicit stack (no recursion, no depth limit).
+# Yields the shared `placed` array (0-indexed columns) -> copy it before keeping it.
+def iterQueensStack(n):
+    full = (1 << n) - 1
+    placed = array("i", [0]) * n    # preallocated placement stack
+    if n == 0:
+        yield placed    # the empty board, as the recursive search returns
+        return
+    # masks can be wider than 64 bits, so they live in preallocated lists
+    free = [0] * n
+    cols = [0] * n
+    left = [0] * n
+    right = [0] * n
+
+    row = 0
+    free[0] = full
+    last = n - 1
+    while row >= 0:
+        f = free[row]
+        if not f:
+            row -= 1    # backtrack
+            continue
+
+        bit = f & -f
+        free[row] = f ^ bit
+        placed[row] = bit.bit_length() - 1
+
+        if row == last:
+            yield placed
+            continue
+
+        c = cols[row] | bit
+        l = ((left[row] | bit) << 1) & full
+        r = (right[row] | bit) >> 1
+        row += 1
+        cols[row] = c
+        left[row] = l
+        right[row] = r
+        free[row] = full & ~(c | l | r)
+
+
+def iter_solutions(n):
+    """
+    Yields the same 1-indexed solutions as backtrackingAlgo, in the same order,
+    one at a time, so callers can count them or stop early without keeping a list.
+    """
+    for placed in iterQueensStack(n):
+        yield [col + 1 for col in placed]
+
+
+# Function to find all solutions (or only the first `limit`) without recursion
+def backtrackingIterative(n, limit=None, record_times=False, start_time=None):
+    """
+    Same results as backtrackingAlgo, in the same order.
+    limit=k stops after the first k solutions (limit=None -> all of them).
+    """
+    result = SolutionSet(n)
+    times = []
+
+    t0 = start_time if start_time is not None else time.perf_counter()
+
+    for placed in islice(iterQueensStack(n), limit):
+        result.append([col + 1 for col in placed])
+        if record_times:
+            times.append(time.perf_counter() - t0)
+
+    if record_times:
+        return result, times
+    return result
+
+
+# Value orders for iterQueensHeuristic
+ORDERS = ("lex", "middle", "lcv")
+
+
+# MRV + forward-checking search for first solutions at large N.
+#   avail[r, c]          -> square still free for an unassigned row
+#   sizes / colsum       -> free squares per row / per column
+#   d1sum / d2sum        -> free squares per "\" (c - r) / "/" (r + c) diagonal
+# Each step takes the unassigned row with the fewest free squares (MRV) and
+# backtracks as soon as some unassigned row has none left (forward checking).
+# Values in that row are tried in `order`:
+#   "lex"    -> left to right
+#   "middle" -> middle columns first
+#   "lcv"    -> least constraining value first (fewest squares taken from the
+#               other rows), ties broken middle-out
+# "middle" is the robust choice for a first solution at large N (every N up to
+# 100 and N=150..1000 in under 2 s); "lcv" has heavy-tailed runs at some N
+# (150, 300, 500 take far longer).
+# The stack is explicit, so any N works regardless of the recursion limit.
+def iterQueensHeuristic(n, order="middle"):
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order {order!r}, expected one of {ORDERS}.")
+    if n == 0:
+        yield []    # the empty board, as the other engines return
+        return
+
+    idx = np.arange(n)
+    middle_dist = np.abs(2 * idx - (n - 1))
+    all_rows, all_cols = np.divmod(np.arange(n * n), n)
+
+    avail = np.ones((n, n), dtype=bool)
+    flat = avail.reshape(-1)
+    sizes = np.full(n, n)
+    colsum = np.full(n, n)
+    d1sum = np.bincount(all_cols - all_rows + n - 1, minlength=2 * n - 1)
+    d2sum = np.bincount(all_cols + all_rows, minlength=2 * n - 1)
+    unassigned = np.ones(n, dtype=bool)
+    placed = np.full(n, -1)
+
+    def update(cells, sign):
+        rows, cols = np.divmod(cells, n)
+        sizes[:] += sign * np.bincount(rows, minlength=n)
+        colsum[:] += sign * np.bincount(cols, minlength=n)
+        d1sum[:] += sign * np.bincount(cols - rows + n - 1, minlength=2 * n - 1)
+        d2sum[:] += sign * np.bincount(cols + rows, minlength=2 * n - 1)
+
+    def assign(row, col):
+        d1 = col + idx - row
+        d2 = col - idx + row
+        cells = np.unique(np.concatenate((
+            row * n + idx,                                        # its row
+            idx * n + col,                                        # its column
+            (idx * n + d1)[(d1 >= 0) & (d1 < n)],                 # "\" diagonal
+            (idx * n + d2)[(d2 >= 0) & (d2 < n)],                 # "/" diagonal
+        )))
+        cleared = cells[flat[cells]]
+        flat[cleared] = False
+        update(cleared, -1)
+        unassigned[row] = False
+        placed[row] = col
+        return cleared
+
+    def unassign(row, cleared):
+        flat[cleared] = True
+        update(cleared, 1)
+        unassigned[row] = True
+        placed[row] = -1
+
+    def candidates(row):
+        cols = np.flatnonzero(avail[row])
+        if order == "lex":
+            return cols.tolist()
+
+        if order == "middle":
+            return cols[np.argsort(middle_dist[cols], kind="stable")].tolist()
+
+        # free squares of the other rows that a queen on (row, col) would take
+        taken = colsum[cols] + d1sum[cols - row + n - 1] + d2sum[cols + row]
+        return cols[np.lexsort((middle_dist[cols], taken))].tolist()
+
+    def next_row():
+        # fewest free squares, ties -> row closest to the middle
+        return int(np.argmin(np.where(unassigned, sizes * n + middle_dist, n * (n + 2))))
+
+    row = next_row()
+    stack = [[row, candidates(row), 0, None]]    # [row, values, next value, cleared squares]
+    while stack:
+        frame = stack[-1]
+        row, values, pos, cleared = frame
+        if cleared is not None:
+            unassign(row, cleared)    # backtrack
+            frame[3] = None
+
+        if pos == len(values):
+            stack.pop()
+            continue
+
+        frame[2] = pos + 1
+        frame[3] = assign(row, values[pos])
+
+        if len(stack) == n:
+            yield (placed + 1).tolist()
+            continue
+
+        # forward checking: some unassigned row has no free square left
+        if not sizes[unassigned].all():
+            continue
+
+        row = next_row()
+        stack.append([row, candidates(row), 0, None])
+
+
+# Level-by-level NumPy search: every partial board of a row is expanded at once.
+#   placed (F, row)    -> columns of the queens placed so far
+#   cols   (F, n)      -> taken columns
+#   d1, d2 (F, 2n - 1) -> taken "\" (row - col) and "/" (row + col) diagonals
+# Children beyond max_frontier are split into chunks that are finished one after
+# another (depth-first), so memory stays bounded.
+def iterFrontierBatches(n, row, placed, cols, d1, d2, max_frontier):
+    if row == n:
+        yield placed
+        return
+
+    idx = np.arange(n)
+    free = ~(cols | d1[:, row - idx + n - 1] | d2[:, row + idx])
+    parent, col = np.nonzero(free)    # row-major -> same order as backtrackingAlgo
+
+    for start in range(0, parent.size, max_frontier):
+        p = parent[start:start + max_frontier]
+        c = col[start:start + max_frontier]
+        k = np.arange(p.size)
+
+        child_cols = cols[p]
+        child_cols[k, c] = True
+        child_d1 = d1[p]
+        child_d1[k, row - c + n - 1] = True
+        child_d2 = d2[p]
+        child_d2[k, row + c] = True
+
+        yield from iterFrontierBatches(
+            n, row + 1, np.column_stack((placed[p], c)),
+            child_cols, child_d1, child_d2, max_frontier,
+        )
+
+
+# Function to find all solutions with the vectorized frontier search
+def backtrackingFrontier(n, max_frontier=100_000, record_times=False, start_time=None):
+    """
+    Same results as backtrackingAlgo, in the same order.
+    max_frontier caps how many partial boards are expanded together.
+    Solutions arrive in batches, so all solutions of a batch share one time.
+    """
+    result = SolutionSet(n)
+    times = []
+
+    t0 = start_time if start_time is not None else time.perf_counter()
+
+    diagonals = max(2 * n - 1, 0)    # n == 0 -> the empty board is the only solution
+    batches = iterFrontierBatches(
+        n, 0,
+        np.zeros((1, 0), dtype=np.int32),
+        np.zeros((1, n), dtype=bool),
+        np.zeros((1, diagonals), dtype=bool),
+        np.zeros((1, diagonals), dtype=bool),
+        max_frontier,
+    )
+    for batch in batches:
+        result.extend(batch + 1)
+        if record_times:
+            times.extend([time.perf_counter() - t0] * len(batch))
+
+    print("\nBacktracking (NumPy frontier) Results:")
+    print(f"Number of Queens : {n}")
+    print(f"Total time taken : {time.perf_counter() - t0:.6f} seconds")
+    if record_times:
+        return result, times
+    return result
+
+
+# The 8 symmetries of the board (rotations + reflections) of a 1-indexed solution
+def symmetries(sol):
+    n = len(sol)
+    q = [int(v) - 1 for v in sol]
+    rot90 = [0] * n
+    for row, col in enumerate(q):
+        rot90[col] = n - 1 - row
+    rot180 = [n - 1 - col for col in reversed(q)]
+    rot270 = [n - 1 - col for col in reversed(rot90)]
+
+    forms = []
+    for base in (q, rot90, rot180, rot270):
+        forms.append(base)                            # rotation
+        forms.append([n - 1 - col for col in base])   # ... mirrored left-right
+    return [[col + 1 for col in form] for form in forms]
+
+
+# All distinct solutions equivalent to sol (1, 2, 4 or 8 of them)
+def expandSolution(sol):
+    return sorted({tuple(form) for form in symmetries(sol)})
+
+
+# Yield every member of every class, only when the caller asks for them
+def expandSolutions(representatives):
+    for sol in representatives:
+        for form in expandSolution(sol):
+            yield list(form)
+
+
+# Solutions that may be the smallest of their 8 symmetries, one at a time.
+# Row 0 only takes columns 0..(n-1)//2 (the mirror image covers the rest).
+# With the first queen on column c, every form of a canonical solution starts
+# with c or more, so the queens of columns 0 and n-1 sit in rows c..n-1-c and
+# the last row's queen in columns c..n-1-c. With a corner queen (c = 0) the
+# transpose starts with 0 too, so the queen of column 1 sits in row q[1] or
+# lower. Branches that break these rules are never entered.
+def iterCanonicalCandidates(n):
+    if n == 0:
+        yield []    # the empty board, as the other searches return
+        return
+    full = (1 << n) - 1
+    edges = 1 | (1 << (n - 1))
+    for col in range((n + 1) // 2):
+        forbid = [edges if row < col or row > n - 1 - col else 0 for row in range(n)]
+        forbid[n - 1] |= full & ~(((1 << (n - 2 * col)) - 1) << col)
+        if col > 0 or n < 3:
+            prefixes = [[col]]
+        else:
+            prefixes = [[0, second] for second in range(2, n)]
+
+        for prefix in prefixes:
+            row_forbid = forbid
+            if len(prefix) == 2:
+                row_forbid = forbid[:]
+                for row in range(2, prefix[1]):
+                    row_forbid[row] |= 2
+            cols, left, right = prefixMasks(n, prefix)
+            yield from iterQueensBitmask(
+                len(prefix), n, full, cols, left, right,
+                prefix + [0] * (n - len(prefix)), row_forbid,
+            )
+
+
+# Function to find one solution per symmetry class
+def backtrackingUnique(n, record_times=False, start_time=None):
+    """
+    Streams the candidates of iterCanonicalCandidates and keeps a solution only
+    if it is the smallest of its 8 symmetries, so every class is found exactly
+    once and no other solution is ever stored.
+
+    If record_times == False  -> returns (representatives, total)
+    If record_times == True   -> returns (representatives, total, times)
+        total is the number of all solutions (sum of the class sizes)
+    """
+    representatives = SolutionSet(n)
+    times = []
+    total = 0
+
+    t0 = start_time if start_time is not None else time.perf_counter()
+
+    for sol in iterCanonicalCandidates(n):
+        forms = symmetries(sol)
+        if sol == min(forms):
+            representatives.append(sol)
+            total += len({tuple(form) for form in forms})
+            if record_times:
+                times.append(time.perf_counter() - t0)
+
+    print("\nBacktracking (unique) Results:")
+    print(f"Number of Queens : {n}")
+    print(f"Unique solutions : {len(representatives)}")
+    print(f"Total solutions  : {total}")
+    print(f"Total time taken : {time.perf_counter() - t0:.6f} seconds")
+    if record_times:
+        return representatives, total, times
+    return representatives, total
+
+
+# All valid placements of the first `depth` rows, in the order backtrackingAlgo visits them
+def prefixTasks(n, depth):
+    full = (1 << n) - 1
+    tasks = [[]]
+    for row in range(min(depth, n)):
+        next_tasks = []
+        for prefix in tasks:
+            cols, left, right = prefixMasks(n, prefix)
+            free = full & ~(cols | left | right)
+            while free:
+                bit = free & -free
+                free ^= bit
+                next_tasks.append(prefix + [bit.bit_length() - 1])
+        tasks = next_tasks
+    return tasks
+
+
+# Rebuild the (cols, left, right) masks seen after placing `prefix` (0-indexed columns)
+def prefixMasks(n, prefix):
+    full = (1 << n) - 1
+    cols = left = right = 0
+    for col in prefix:
+        bit = 1 << col
+        cols |= bit
+        left = ((left | bit) << 1) & full
+        right = (right | bit) >> 1
+    return cols, left, right
+
+
+# Worker: finish the search below one prefix.
+# perf_counter() values only compare within one process, so times are offsets
+# from the worker's own start, returned with the time the prefix took.
+def solvePrefix(n, prefix, record_times):
+    t0 = time.perf_counter()
+    cols, left, right = prefixMasks(n, prefix)
+    placed = prefix + [0] * (n - len(prefix))
+    result = SolutionSet(n)
+    times = []
+    placeQueensBitmask(
+        len(prefix), n, (1 << n) - 1, cols, left, right,
+        placed, result, times, record_times, t0,
+    )
+    return result, times, time.perf_counter() - t0
+
+
+# Function to find all solutions on several processes
+def backtrackingParallel(n, workers=None, prefix_depth=2, record_times=False,
+                         start_time=None, should_stop=None):
+    """
+    Splits the tree by the queens of the first `prefix_depth` rows and hands the
+    subproblems to a process pool one at a time, so idle workers pick up the next
+    prefix (dynamic distribution).
+
+    Same return values as backtrackingAlgo, with solutions in the same order.
+    should_stop() is polled after every finished prefix; if it returns True the
+    pending prefixes are dropped and the solutions found so far are returned.
+    Solution times are offsets measured inside each worker, placed on this
+    process's clock when the prefix's result arrives (so they run late by the
+    time a result takes to come back).
+    """
+    t0 = start_time if start_time is not None else time.perf_counter()
+
+    tasks = prefixTasks(n, prefix_depth)
+    parts = [None] * len(tasks)
+
+    # "spawn" so workers never inherit the GUI's threads / Tk state through fork
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {
+            pool.submit(solvePrefix, n, prefix, record_times): idx
+            for idx, prefix in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            part, part_times, part_elapsed = future.result()
+            # the prefix started part_elapsed before its result got back here
+            part_start = time.perf_counter() - part_elapsed
+            parts[futures[future]] = part, [part_start + offset for offset in part_times]
+            if should_stop is not None and should_stop():
+                for pending in futures:
+                    pending.cancel()
+                break
+
+    result = SolutionSet(n)
+    times = []
+    for part in parts:
+        if part is None:
+            continue
+        result.extend(part[0])
+        times.extend(stamp - t0 for stamp in part[1])
+
+    print("\nBacktracking (parallel) Results:")
+    print(f"Number of Queens : {n}")
+    print(f"Subproblems      : {len(tasks)}")
+    print(f"Total time taken : {time.perf_counter() - t0:.6f} seconds")
+    if record_times:
+        return result, times
+    return result
+
+
+# Old matrix-scan version, kept as a reference for the benchmark
+def backtrackingMatrix(n):
+    mat = [[0] * n for _ in range(n)]
+    result = []
+    placeQueens(0, mat, result, [], False, time.perf_counter())
+    return result
+
+
+# Compare bitmask search against the matrix-scan search
+def benchmark(n_values=range(8, 15)):
+    print(f"{'N':>3} {'solutions':>10} {'matrix (s)':>12} {'bitmask (s)':>12} {'speedup':>8}")
+    for n in n_values:
+        t0 = time.perf_counter()
+        slow = backtrackingMatrix(n)
+        t_matrix = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        fast = []
+        placeQueensBitmask(0, n, (1 << n) - 1, 0, 0, 0, [0] * n, fast, [], False, t0)
+        t_bitmask = time.perf_counter() - t0
+
+        assert fast == slow, f"bitmask and matrix results differ for N = {n}"
+        print(f"{n:>3} {len(fast):>10} {t_matrix:>12.4f} {t_bitmask:>12.4f} {t_matrix / t_bitmask:>7.1f}x")
+
+
+# Parallel speedup over the single-process bitmask search
+def benchmarkParallel(n_values=range(12, 18), workers=None):
+    print(f"{'N':>3} {'solutions':>10} {'serial (s)':>12} {'parallel (s)':>13} {'speedup':>8}")
+    for n in n_values:
+        t0 = time.perf_counter()
+        serial = backtrackingAlgo(n)
+        t_serial = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        parallel = backtrackingParallel(n, workers=workers)
+        t_parallel = time.perf_counter() - t0
+
+        assert parallel == serial, f"parallel and serial results differ for N = {n}"
+        print(f"{n:>3} {len(serial):>10} {t_serial:>12.4f} {t_parallel:>13.4f} {t_serial / t_parallel:>7.1f}x")
+
+
+# Explicit-stack search against the recursive bitmask search
+def benchmarkIterative(n_values=range(4, 13), first_n_values=(20, 21, 23, 25, 27)):
+    print(f"{'N':>3} {'solutions':>10} {'recursive (s)':>14} {'iterative (s)':>14} {'speedup':>8}")
+    for n in n_values:
+        t0 = time.perf_counter()
+        recursive = []
+        placeQueensBitmask(0, n, (1 << n) - 1, 0, 0, 0, [0] * n, recursive, [], False, t0)
+        t_recursive = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        iterative = backtrackingIterative(n)
+        t_iterative = time.perf_counter() - t0
+
+        assert iterative == recursive, f"iterative and recursive results differ for N = {n}"
+        print(f"{n:>3} {len(iterative):>10} {t_recursive:>14.4f} {t_iterative:>14.4f} {t_recursive / t_iterative:>7.1f}x")
+
+    print(f"\n{'N':>3} {'first (recursive, s)':>21} {'first (iterative, s)':>21}")
+    for n in first_n_values:
+        t0 = time.perf_counter()
+        first_recursive = next(iterQueensBitmask(0, n, (1 << n) - 1, 0, 0, 0, [0] * n))
+        t_recursive = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        first_iterative = backtrackingIterative(n, limit=1)[0]
+        t_iterative = time.perf_counter() - t0
+
+        assert first_iterative == first_recursive
+        print(f"{n:>3} {t_recursive:>21.4f} {t_iterative:>21.4f}")
+
+
+# Vectorized frontier search against the recursive bitmask search
+def benchmarkFrontier(n_values=range(8, 15), max_frontier=100_000):
+    print(f"{'N':>3} {'solutions':>10} {'bitmask (s)':>12} {'frontier (s)':>13} {'speedup':>8}")
+    for n in n_values:
+        t0 = time.perf_counter()
+        bitmask = []
+        placeQueensBitmask(0, n, (1 << n) - 1, 0, 0, 0, [0] * n, bitmask, [], False, t0)
+        t_bitmask = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        frontier = backtrackingFrontier(n, max_frontier=max_frontier)
+        t_frontier = time.perf_counter() - t0
+
+        assert frontier == bitmask, f"frontier and bitmask results differ for N = {n}"
+        print(f"{n:>3} {len(bitmask):>10} {t_bitmask:>12.4f} {t_frontier:>13.4f} {t_bitmask / t_frontier:>7.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
+    benchmarkIterative()
+    benchmarkFrontier()
+    benchmarkParallel()
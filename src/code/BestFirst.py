@@ -1,7 +1,10 @@
 import random
 import heapq
+import itertools
 import time
 
+from visited_set import VISITED_BACKENDS, make_visited
+
 class BestFirst:
     def __init__(self):
         self.solutions = []
@@ -10,6 +13,10 @@ class BestFirst:
         self.start_index_column = -1
         self.time_taken = 0
         self.steps = 0
+        self.expanded = 0
+        self.visited_bytes = 0
+        self.peak_frontier = 0
+        self.dropped = 0
 
     # ---------------------------------------------------------------
     # Simple N validation
@@ -33,68 +40,123 @@ class BestFirst:
         return conflicts
 
     # ---------------------------------------------------------------
-    # Create neighbors by changing row of each column
+    # Queens per row / per diagonal, for O(1) child heuristics
+    # ---------------------------------------------------------------
+    def line_counts(self, board):
+        n = len(board)
+        rows = [0] * n
+        diag1 = [0] * (2 * n - 1)    # row - col + n - 1
+        diag2 = [0] * (2 * n - 1)    # row + col
+        for col, row in enumerate(board):
+            rows[row] += 1
+            diag1[row - col + n - 1] += 1
+            diag2[row + col] += 1
+        return rows, diag1, diag2
+
+    # ---------------------------------------------------------------
+    # Child moves (col, row) with their heuristic, from the parent's
+    # heuristic h and line counts: the queen leaves lines holding k
+    # queens (-(k - 1) pairs each) and joins lines holding m (+m each)
     # ---------------------------------------------------------------
-    def generate_children(self, board):
-        children = []
+    def child_moves(self, board, h, counts):
+        rows, diag1, diag2 = counts
         n = len(board)
 
         for col in range(n):
             original_row = board[col]
+            leave = rows[original_row] + diag1[original_row - col + n - 1] + diag2[original_row + col] - 3
             for row in range(n):
                 if row != original_row:
-                    new_board = board.copy()
-                    new_board[col] = row
-                    children.append(new_board)
-        return children
+                    yield h + rows[row] + diag1[row - col + n - 1] + diag2[row + col] - leave, col, row
 
     # ---------------------------------------------------------------
     # Best-First Search algorithm
     # ---------------------------------------------------------------
-    def solve(self, N=4):
+    def solve(self, N=4, visited="tuple", max_frontier=None):
+        """
+        visited: "tuple", "zobrist" or "bloom" (see visited_set.py).
+        max_frontier: cap on the frontier; when an expansion takes it past
+        the cap, only the best half (lowest h, oldest first) is kept.
+        Bounded beam-style search that may miss a solution.
+        None -> unbounded best-first.
+        """
         self.validate_n(N)
 
         start_time = time.time()
         self.steps = 0
+        self.peak_frontier = 0
+        self.dropped = 0
 
         # Random initial board
         self.board = [random.randint(0, N - 1) for _ in range(N)]
         self.start_index_row = self.board[0]
         self.start_index_column = 0
 
+        # Frontier entries: (h, tie, parent board, parent key, col, row)
+        # the child is the parent with the queen of `col` moved to `row`,
+        # rebuilt only when popped; `tie` keeps heapq from comparing boards
+        tie = itertools.count()
         pq = []
-        heapq.heappush(pq, (self.heuristic(self.board), self.board))
+        heapq.heappush(pq, (self.heuristic(self.board), next(tie), None, None, 0, self.board[0]))
 
-        visited = set()
+        visited = make_visited(visited, N)
 
         while pq:
-            h, current = heapq.heappop(pq)
+            h, _, parent, parent_key, col, row = heapq.heappop(pq)
             self.steps += 1
 
-            state = tuple(current)
-            if state in visited:
+            if parent is None:
+                key = visited.key(self.board)
+            else:
+                key = visited.child_key(parent_key, col, parent[col], row)
+            if key in visited:
                 continue
-            visited.add(state)
+            visited.add(key)
+
+            if parent is None:
+                current = self.board
+            else:
+                current = parent.copy()
+                current[col] = row
 
             # Goal found
             if h == 0:
                 self.time_taken = time.time() - start_time
                 self.solutions.append(current)
+                self.record_visited(visited)
                 print("\nBest-First Search Results:")
                 print(f"Number of Queens : {N}")
+                print(f"Visited memory   : {self.visited_bytes} bytes "
+                      f"({self.visited_bytes / self.expanded:.1f} per expanded node)")
+                print(f"Peak frontier    : {self.peak_frontier} ({self.dropped} dropped)")
                 print(f"Total time taken : {self.time_taken:.6f} seconds")
                 return current
 
-            for child in self.generate_children(current):
-                c_state = tuple(child)
-                if c_state not in visited:
-                    heapq.heappush(pq, (self.heuristic(child), child))
+            counts = self.line_counts(current)
+            for child_h, col, row in self.child_moves(current, h, counts):
+                if visited.child_key(key, col, current[col], row) not in visited:
+                    heapq.heappush(pq, (child_h, next(tie), current, key, col, row))
+
+            self.peak_frontier = max(self.peak_frontier, len(pq))
+            if max_frontier is not None and len(pq) > max_frontier:
+                # keep the best half, so the O(F log F) trim is paid once
+                # per max_frontier / 2 pushes; a sorted list is a valid heap
+                pq.sort()
+                keep = max(1, max_frontier // 2)
+                self.dropped += len(pq) - keep
+                del pq[keep:]
 
         self.time_taken = time.time() - start_time
+        self.record_visited(visited)
         print("\nBest-First Search Results:")
         print("No solution found")
+        print(f"Peak frontier    : {self.peak_frontier} ({self.dropped} dropped)")
         return None
 
+    def record_visited(self, visited):
+        self.expanded = len(visited)
+        self.visited_bytes = visited.nbytes
+
     # ---------------------------------------------------------------
     # Generate a readable solution report
     # ---------------------------------------------------------------
@@ -118,7 +180,32 @@ class BestFirst:
         report.append(f"\nStart Index: row = {self.start_index_row}, col = {self.start_index_column}")
         report.append(f"Solutions found: {len(self.solutions)}")
         report.append(f"Steps Taken: {self.steps}")
+        if self.expanded:
+            report.append(f"Visited memory: {self.visited_bytes} bytes "
+                          f"({self.visited_bytes / self.expanded:.1f} per expanded node)")
+        report.append(f"Peak frontier: {self.peak_frontier} ({self.dropped} dropped)")
         report.append(f"Time Taken: {self.time_taken:.6f} seconds")
 
         return "\n".join(report)
 
+
+
+# Visited-set memory per expanded node, per backend
+def benchmark_visited(n_values=(8, 12, 16, 20, 30), seeds=range(3)):
+    import contextlib
+    import io
+
+    print(f"{'N':>3} {'backend':>8} {'expanded':>9} {'bytes/node':>11} {'time (s)':>9}")
+    for n in n_values:
+        for backend in VISITED_BACKENDS:
+            expanded = nbytes = elapsed = 0
+            for seed in seeds:
+                random.seed(seed)
+                solver = BestFirst()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    solver.solve(n, visited=backend)
+                expanded += solver.expanded
+                nbytes += solver.visited_bytes
+                elapsed += solver.time_taken
+            print(f"{n:>3} {backend:>8} {expanded // len(seeds):>9} "
+                  f"{nbytes / expanded:>11.1f} {elapsed / len(seeds):>9.4f}")
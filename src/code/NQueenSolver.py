@@ -4,6 +4,7 @@ import globals as g
 import constants
 import algo_demo
 import board_drawer
+from solution_set import SolutionSet
 import time  # For measuring time
 
 
@@ -24,12 +25,22 @@ def solve(root):
     start_time = time.perf_counter()
 
     # ---- NORMAL SWITCH CASE ----
-    if strategy == constants.ALGO_BACKTRACKING:
+    if strategy == constants.ALGO_BACKTRACKING and n > constants.BACKTRACK_ALL_SOLUTIONS_MAX_N:
         g.solutions, solution_times = algo_demo.backtracking(
-            n, record_times=True, start_time=start_time
+            n, record_times=True, start_time=start_time,
+            limit=1, order=constants.BACKTRACK_FIRST_ORDER,
         )
         end_time = time.perf_counter()
 
+    elif strategy == constants.ALGO_BACKTRACKING:
+        g.solutions, solution_times = SolutionSet(n), []
+        for sol, sol_time in algo_demo.iter_backtracking(n, start_time=start_time):
+            if g.cancel_flag:
+                break
+            g.solutions.append(sol)
+            solution_times.append(sol_time)
+        end_time = time.perf_counter()
+
     elif strategy == constants.ALGO_BEST_FIRST:
         g.solutions = algo_demo.best_first(n)
         end_time = time.perf_counter()
@@ -42,8 +53,24 @@ def solve(root):
         g.solutions = algo_demo.cultural(n, start_time)
         end_time = time.perf_counter()
 
+    elif strategy == constants.ALGO_CONSTRUCTIVE:
+        g.solutions = algo_demo.constructive(n)
+        end_time = time.perf_counter()
+
+    elif strategy == constants.ALGO_MIN_CONFLICTS:
+        g.solutions = algo_demo.min_conflicts(n)
+        end_time = time.perf_counter()
+
+    elif strategy == constants.ALGO_ANNEALING:
+        g.solutions = algo_demo.simulated_annealing(n)
+        end_time = time.perf_counter()
+
+    elif strategy == constants.ALGO_TABU:
+        g.solutions = algo_demo.tabu_search(n)
+        end_time = time.perf_counter()
+
     else:
-        g.solutions = []
+        g.solutions = SolutionSet(n)
         root.config(cursor="")
         if g.status_var is not None:
             g.status_var.set("Unknown strategy")
@@ -75,7 +102,7 @@ def solve(root):
     if strategy == constants.ALGO_BACKTRACKING:
         print("Backtracking Results:")
         for idx, (sol, sol_time) in enumerate(zip(g.solutions, solution_times), start=1):
-            print(f"Solution {idx}: Time: {sol_time:.4f}s, Solution: {sol}")
+            print(f"Solution {idx}: Time: {sol_time:.4f}s, Solution: {sol.tolist()}")
     else:
         print(f"{strategy} Results:")
         print(f"Total Time: {elapsed_time:.4f}s, Solutions: {len(g.solutions)}")
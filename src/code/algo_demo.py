@@ -2,8 +2,28 @@
 import random
 from CulturalAlgorithm import cultural_algorithm
 from BestFirst import BestFirst
-from BackTrack import backtrackingAlgo
-from hillclimb import hill_climb
+from BackTrack import (
+    backtrackingAlgo,
+    backtrackingParallel,
+    backtrackingUnique,
+    countSolutions,
+    countSolutionsParallel,
+    expandSolutions,
+    iter_solutions,
+)
+from hillclimb import (
+    first_choice_hill_climb,
+    hill_climb,
+    hill_climb_batch,
+    hill_climb_parallel,
+    perm_hill_climb,
+)
+from constructive import constructive as construct
+from min_conflicts import min_conflicts as min_conflicts_search
+from simulated_annealing import simulated_annealing as anneal
+from tabu_search import tabu_search as tabu
+from solution_store import default_store
+from solution_set import SolutionSet
 import globals as g
 
 
@@ -18,14 +38,35 @@ import globals as g
 import time
 import globals as g
 
-def backtracking(n, record_times=False, start_time=None):
+def backtracking(n, record_times=False, start_time=None, count_only=False,
+                 parallel=False, checkpoint=None, resume=False, limit=None, order=None,
+                 use_store=True):
     """
     If record_times == False  -> returns [solutions]
     If record_times == True   -> returns (solutions, times)
         where times[i] is the time (sec) when solution i was found
+        (limit=k -> only the first k solutions,
+         order="lex"/"middle"/"lcv" -> MRV + forward-checking search)
+    If count_only == True     -> returns (count, nodes, elapsed)
+        without building any solution list
+        (parallel / checkpoint / resume only apply to this mode)
+
+    Full enumerations are read from the solution store when it has this N,
+    and saved to it otherwise (use_store=False always recomputes).
     """
+    if count_only:
+        count = countSolutionsParallel if parallel else countSolutions
+        return count(n, start_time=start_time, checkpoint=checkpoint, resume=resume)
 
-    solutions, times = backtrackingAlgo(n, record_times=True)
+    if use_store and limit is None and order is None:
+        solutions, times = SolutionSet(n), []
+        for sol, sol_time in iter_backtracking(n, start_time=start_time):
+            solutions.append(sol)
+            times.append(sol_time)
+    else:
+        solutions, times = backtrackingAlgo(
+            n, record_times=True, start_time=start_time, limit=limit, order=order
+        )
  
     if record_times:
         return solutions, times  # Return both solutions and times for each solution
@@ -33,6 +74,47 @@ def backtracking(n, record_times=False, start_time=None):
     return solutions
 
 
+def iter_backtracking(n, start_time=None, use_store=True):
+    """
+    Streaming version of backtracking():
+    yields (solution, time) pairs where time (sec) is when the solution was found
+    (read from the solution store when possible, see backtracking())
+    """
+    t0 = start_time if start_time is not None else time.perf_counter()
+
+    solutions = default_store.iter_solutions(n) if use_store else iter_solutions(n)
+    for solution in solutions:
+        yield solution, time.perf_counter() - t0
+
+
+def backtracking_parallel(n, start_time=None, workers=None, should_stop=None):
+    """
+    Same enumeration spread over a process pool.
+    Returns (solutions, times); stops early once should_stop() is True.
+    """
+    return backtrackingParallel(
+        n,
+        workers=workers,
+        record_times=True,
+        start_time=start_time,
+        should_stop=should_stop,
+    )
+
+
+def backtracking_unique(n, expand=False):
+    """
+    One representative per symmetry class.
+    Returns (representatives, unique_count, total_count);
+    with expand=True the first item is every solution instead.
+    """
+    representatives, total = backtrackingUnique(n)
+
+    if expand:
+        return list(expandSolutions(representatives)), len(representatives), total
+
+    return representatives, len(representatives), total
+
+
 
 # =========================
 # Helpers for meta-heuristics
@@ -77,43 +159,58 @@ def generate_neighbors(board):
 # =========================
 # 2) BEST-FIRST SEARCH
 # =========================
-def best_first(n, max_iter=5000):
+def best_first(n, max_iter=5000, visited="tuple", max_frontier=None):
     """
     Greedy best-first search on heuristic.
-    Returns [solution] or [].
+    visited -> "tuple", "zobrist" or "bloom" set of expanded boards.
+    max_frontier -> cap on the open list (worst entries dropped), None = unbounded.
+    Returns a SolutionSet with one solution, or an empty one.
     """
     g.cancel_flag = False
 
     solver = BestFirst()
-    solution = solver.solve(n)
+    solution = solver.solve(n, visited=visited, max_frontier=max_frontier)
 
     if solution:
         solution = [x + 1 for x in solution]
-        return [solution]
+        return SolutionSet(n, [solution])
 
     # no solution found
-    return []
+    return SolutionSet(n)
 
 
 # =========================
 # 3) HILL-CLIMBING
 # =========================
-def hill_climbing(n, max_steps=1000, restarts=20):
+def hill_climbing(n, max_steps=1000, restarts=20, batch=None, workers=None, permutation=False,
+                  first_choice=False):
     """
     Simple hill-climbing.
-    Returns [solution] or [].
+    permutation=True -> permutation states with column-swap moves.
+    first_choice=True -> take the first improving random move, not the best one.
+    batch=K -> K restarts advance together as one (K, n) NumPy state matrix.
+    workers=W -> restarts spread over W processes, first solution wins.
+    Returns a SolutionSet with one solution, or an empty one.
     """
     g.cancel_flag = False
 
-    state, board, elapsed = hill_climb(n)
+    if first_choice:
+        state, board, elapsed = first_choice_hill_climb(n)
+    elif permutation:
+        state, board, elapsed = perm_hill_climb(n)
+    elif workers:
+        state, board, elapsed = hill_climb_parallel(n, workers=workers)
+    elif batch:
+        state, board, elapsed = hill_climb_batch(n, batch=batch)
+    else:
+        state, board, elapsed = hill_climb(n)
 
     print("state ====>", state)
 
-    if state.any():
-        state = [x + 1 for x in state]
-        return [state]
-    
-    return []
+    if state is not None:
+        return SolutionSet(n, [state + 1])
+
+    return SolutionSet(n)
 
 
 # =========================
@@ -123,7 +220,7 @@ def cultural(n,time, population_size=30, generations=200, mutation_rate=0.2):
     """
     Simple evolutionary-like search (not a full academic cultural algorithm,
     but good as a 'cultural' demo).
-    Returns [solution] or [].
+    Returns a SolutionSet with one solution, or an empty one.
     """
     solution, gen, time = cultural_algorithm(n, time, population_size= 50, time_limit_seconds=60) # one-minute limit
     print(f"\nCultural Algorithm Results(2):")
@@ -132,6 +229,80 @@ def cultural(n,time, population_size=30, generations=200, mutation_rate=0.2):
     print("solution ====>", solution)
 
     if solution:
-        return [solution]
+        return SolutionSet(n, [solution])
+
+    return SolutionSet(n)  # no solution found
+
+
+# =========================
+# 5) CONSTRUCTIVE (explicit formula, O(n))
+# =========================
+def constructive(n):
+    """
+    Direct construction, no search; instant even for very large n.
+    Returns a SolutionSet with one solution, or an empty one (n = 2, 3).
+    """
+    state, elapsed = construct(n)
+
+    if state is not None:
+        return SolutionSet(n, [state + 1])
+
+    return SolutionSet(n)
+
+
+# =========================
+# 6) MIN-CONFLICTS (local search with conflict counters)
+# =========================
+def min_conflicts(n, max_steps=100000):
+    """
+    Repairs a greedy start by moving conflicted queens to their least
+    attacked row; handles n up to 10^6.
+    Returns a SolutionSet with one solution, or an empty one.
+    """
+    g.cancel_flag = False
+
+    state, steps, elapsed = min_conflicts_search(n, max_steps=max_steps)
+
+    if state is not None:
+        return SolutionSet(n, [state + 1])
+
+    return SolutionSet(n)
+
+
+# =========================
+# 7) SIMULATED ANNEALING (on the hill-climbing state)
+# =========================
+def simulated_annealing(n, max_steps=None, schedule="geometric"):
+    """
+    Hill-climbing moves, but worse ones are accepted while the temperature is
+    high; reheats instead of restarting when it stalls.
+    max_steps=None -> scaled with n (see simulated_annealing.py).
+    Returns a SolutionSet with one solution, or an empty one.
+    """
+    g.cancel_flag = False
+
+    state, steps, elapsed = anneal(n, max_steps=max_steps, schedule=schedule)
+
+    if state is not None:
+        return SolutionSet(n, [state + 1])
+
+    return SolutionSet(n)
+
+
+# =========================
+# 8) TABU SEARCH (on the hill-climbing state)
+# =========================
+def tabu_search(n, max_iterations=100000):
+    """
+    Always takes the best move of a conflicted queen, and keeps a short memory
+    of recent moves so it cannot walk straight back; no restarts.
+    Returns a SolutionSet with one solution, or an empty one.
+    """
+    g.cancel_flag = False
+
+    state, iterations, evaluations, elapsed = tabu(n, max_iterations=max_iterations)
+
+    if state is not None:
+        return SolutionSet(n, [state + 1])
 
-    return []  # no solution found
+    return SolutionSet(n)
@@ -1,3 +1,4 @@
+import os
 
 QUEEN_LOGO = "♛"
 
@@ -7,8 +8,39 @@ SPLASH_TIME = 3000  # milliseconds = 3 seconds
 # times to run the algos for reporting
 N_Times = 4
 
+# backtracking report runs on a process pool from this N up, and only with at
+# least two CPUs: starting a "spawn" worker costs ~0.5 s, about what the whole
+# serial search takes at N = 12 (N = 11: 0.2 s, N = 13: 5.8 s)
+BACKTRACK_PARALLEL_MIN_N = 13
+BACKTRACK_PARALLEL_MIN_CPUS = 2
+BACKTRACK_WORKERS = None  # None -> one worker per CPU
+
+# Solve lists every backtracking solution up to this N;
+# above it, only the first one found with the MRV search in this value order
+BACKTRACK_ALL_SOLUTIONS_MAX_N = 12
+BACKTRACK_FIRST_ORDER = "middle"
+
+# hill-climbing report runs advance this many restarts together, but only for
+# N in [HILL_CLIMB_BATCH_MIN_N, HILL_CLIMB_BATCH_MAX_N]: measured over 100 runs,
+# batches of 8 are faster for N = 6..16 (N = 6: 3.1 vs 11.0 ms) and slower
+# outside it (N = 20: 7.1 vs 5.1 ms), where plain hill_climb is used
+# (None -> always plain hill_climb)
+HILL_CLIMB_BATCH = 8
+HILL_CLIMB_BATCH_MIN_N = 6
+HILL_CLIMB_BATCH_MAX_N = 16
+
+# best-first report runs keep at most this many open entries (the worst are
+# dropped) and remember expanded boards by Zobrist hash, so concurrent runs
+# stay within a bounded amount of memory
+BEST_FIRST_MAX_FRONTIER = 100_000
+BEST_FIRST_VISITED = "zobrist"
+
 # images
 QUEEN_IMAGE = "src/code/queen_icon.jpg"
+
+# on-disk cache of backtracking solutions (one file per N), next to this
+# module whatever the working directory is (gitignored as src/code/solution_store/)
+SOLUTION_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solution_store")
 FIXED_IMAGE_SIZE = 200
 
 # Color codes
@@ -21,13 +53,21 @@ ALGO_BACKTRACKING = "Backtracking"
 ALGO_BEST_FIRST   = "Best-first"
 ALGO_HILL_CLIMB   = "Hill-climbing"
 ALGO_CULTURAL     = "Cultural"
+ALGO_CONSTRUCTIVE = "Constructive"
+ALGO_MIN_CONFLICTS = "Min-conflicts"
+ALGO_ANNEALING = "Simulated annealing"
+ALGO_TABU = "Tabu search"
 
 # grouped list for combo box
 ALGO_LIST = [
     ALGO_BACKTRACKING,
     ALGO_BEST_FIRST,
     ALGO_HILL_CLIMB,
-    ALGO_CULTURAL
+    ALGO_CULTURAL,
+    ALGO_CONSTRUCTIVE,
+    ALGO_MIN_CONFLICTS,
+    ALGO_ANNEALING,
+    ALGO_TABU,
 ]
 
 # board panel
@@ -40,4 +80,8 @@ ALGO_COLORS = {
     ALGO_BEST_FIRST:   "magenta",
     ALGO_HILL_CLIMB:   "orange",
     ALGO_CULTURAL:     "yellow",
+    ALGO_CONSTRUCTIVE: "green",
+    ALGO_MIN_CONFLICTS: "cyan",
+    ALGO_ANNEALING: "purple",
+    ALGO_TABU: "brown",
 }
\ No newline at end of file
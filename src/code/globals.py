@@ -1,6 +1,7 @@
 import constants
+from solution_set import SolutionSet
 
-solutions = []
+solutions = SolutionSet()
 canvas = None
 n_var = None
 strategy_var = None
@@ -24,10 +25,14 @@ timer_running = False
 timer_label = None
 
 
-# Global results: strategy -> {"solutions": [...], "times": [...]}
+# Global results: strategy -> {"solutions": SolutionSet, "times": [...]}
 algorithm_results = {
-    constants.ALGO_BACKTRACKING: {"solutions": [], "times": []},
-    constants.ALGO_BEST_FIRST:   {"solutions": [], "times": []},
-    constants.ALGO_HILL_CLIMB:   {"solutions": [], "times": []},
-    constants.ALGO_CULTURAL:     {"solutions": [], "times": []},
+    constants.ALGO_BACKTRACKING: {"solutions": SolutionSet(), "times": []},
+    constants.ALGO_BEST_FIRST:   {"solutions": SolutionSet(), "times": []},
+    constants.ALGO_HILL_CLIMB:   {"solutions": SolutionSet(), "times": []},
+    constants.ALGO_CULTURAL:     {"solutions": SolutionSet(), "times": []},
+    constants.ALGO_CONSTRUCTIVE: {"solutions": SolutionSet(), "times": []},
+    constants.ALGO_MIN_CONFLICTS: {"solutions": SolutionSet(), "times": []},
+    constants.ALGO_ANNEALING: {"solutions": SolutionSet(), "times": []},
+    constants.ALGO_TABU: {"solutions": SolutionSet(), "times": []},
 }
\ No newline at end of file
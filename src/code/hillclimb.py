@@ -1,14 +1,21 @@
+import multiprocessing
+import os
+import random
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from numpy.lib.stride_tricks import sliding_window_view
 from random import choice
 from time import perf_counter
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 
 def ensure_N(n: int) -> int:
     return max(4, int(n))
 
 
-def random_state(N: int) -> np.ndarray:
+def random_state(N: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    if rng is not None:
+        return rng.integers(0, N, size=N)
     return np.random.randint(0, N, size=N)
 
 
@@ -30,24 +37,115 @@ def objective(state: np.ndarray) -> int:
     return int(comb2(rows_count).sum() + comb2(d1).sum() + comb2(d2).sum())
 
 
-def best_neighbor(state: np.ndarray) -> Tuple[np.ndarray, int]:
+def line_counts(state: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Queens per row, per "\\" diagonal (row - col) and per "/" diagonal (row + col)."""
+    N = state.size
+    cols = np.arange(N)
+    rows_count = np.bincount(state, minlength=N)
+    d1 = np.bincount(state - cols + (N - 1), minlength=2 * N - 1)
+    d2 = np.bincount(state + cols, minlength=2 * N - 1)
+    return rows_count, d1, d2
+
+
+def apply_move(state: np.ndarray, counts: Tuple[np.ndarray, np.ndarray, np.ndarray], col: int, row: int) -> None:
+    """Moves the queen of `col` to `row`, updating state and counts in place."""
     N = state.size
-    best_obj = objective(state)
+    rows_count, d1, d2 = counts
+    old = state[col]
+    rows_count[old] -= 1
+    d1[old - col + N - 1] -= 1
+    d2[old + col] -= 1
+    rows_count[row] += 1
+    d1[row - col + N - 1] += 1
+    d2[row + col] += 1
+    state[col] = row
+
+
+def neighbor_costs(
+    state: np.ndarray, counts: Tuple[np.ndarray, np.ndarray, np.ndarray], cur_obj: int
+) -> np.ndarray:
+    """
+    (N, N) matrix whose [col, row] entry is the objective after moving the queen
+    of `col` to `row`, built in one broadcast from the counts: the queen leaves
+    lines holding k queens (-(k - 1) pairs each) and joins lines holding m
+    queens (+m pairs each). Staying put is not a move, so [col, state[col]] is
+    set to the dtype's max.
+    """
+    N = state.size
+    rows_count, d1, d2 = counts
+    cols = np.arange(N)
+    # row r of column c lies on d1[r - c + N - 1] and d2[r + c]: for each column
+    # those are N-long windows of the diagonal counts, taken as strided views
+    d1_windows = sliding_window_view(d1, N)[::-1]
+    d2_windows = sliding_window_view(d2, N)
+
+    leave = rows_count[state] + d1[state - cols + (N - 1)] + d2[state + cols] - 3
+    costs = rows_count[None, :] + d1_windows + d2_windows - leave[:, None] + cur_obj
+    costs[cols, state] = np.iinfo(costs.dtype).max
+    return costs
+
+
+def best_moves(
+    state: np.ndarray, counts: Tuple[np.ndarray, np.ndarray, np.ndarray], cur_obj: int
+) -> Tuple[int, np.ndarray]:
+    """
+    Lowest objective reachable by moving one queen, and the flat indices
+    (col * N + row) of every move that reaches it, in column-major scan order.
+    """
+    costs = neighbor_costs(state, counts, cur_obj).ravel()
+    best_obj = int(costs.min())
+    return best_obj, np.flatnonzero(costs == best_obj)
+
+
+def best_neighbor(state: np.ndarray) -> Tuple[np.ndarray, int]:
+    cur_obj = objective(state)
+    best_obj, moves = best_moves(state, line_counts(state), cur_obj)
     best_state = state.copy()
+    if best_obj < cur_obj:
+        col, row = divmod(int(moves[0]), state.size)
+        best_state[col] = row
+        return best_state, best_obj
+    return best_state, cur_obj
 
-    for col in range(N):
-        orig_row = state[col]
-        for r in range(N):
-            if r == orig_row:
-                continue
-            state[col] = r
-            obj = objective(state)
-            if obj < best_obj:
-                best_obj = obj
-                best_state = state.copy()
-        state[col] = orig_row
 
-    return best_state, best_obj
+def climb(
+    N: int,
+    max_sideways: int = 100,
+    max_iterations: int = 10000,
+    rng: Optional[np.random.Generator] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Tuple[Optional[np.ndarray], int]:
+    """
+    One restart of steepest-ascent hill climbing with sideways moves.
+    Draws from `rng` when given (seedable, one per worker), otherwise from the
+    global NumPy / random state. should_stop() is polled every 100 iterations.
+    Returns (state, iterations); state is None if the climb got stuck or stopped.
+    """
+    state = random_state(N, rng)
+    counts = line_counts(state)
+    cur_obj = objective(state)
+    side_count = 0
+
+    for it in range(max_iterations):
+        if cur_obj == 0:
+            return state, it
+        if should_stop is not None and it % 100 == 0 and should_stop():
+            return None, it
+
+        neigh_obj, moves = best_moves(state, counts, cur_obj)
+
+        if neigh_obj < cur_obj:
+            apply_move(state, counts, *divmod(int(moves[0]), N))
+            cur_obj = neigh_obj
+            side_count = 0
+        elif neigh_obj == cur_obj and side_count < max_sideways:
+            # sideways move: any of the equally good neighbours
+            move = moves[rng.integers(moves.size)] if rng is not None else choice(moves)
+            apply_move(state, counts, *divmod(int(move), N))
+            side_count += 1
+        else:
+            return None, it
+    return None, max_iterations
 
 
 def hill_climb(
@@ -59,42 +157,429 @@ def hill_climb(
     start_time = perf_counter()
 
     for restart in range(max_restarts):
-        state = random_state(N)
-        side_count = 0
-
-        for it in range(max_iterations):
-            cur_obj = objective(state)
-            if cur_obj == 0:
-                elapsed = perf_counter() - start_time
-                print("\nHill Climbing Results:")
-                print(f"Number of Queens : {N}")
-                print(f"Total time taken : {elapsed:.6f} seconds")
-                return state, board_from_state(state), elapsed
-
-            neigh_state, neigh_obj = best_neighbor(state)
-
-            if neigh_obj < cur_obj:
-                state = neigh_state
-                side_count = 0
-            elif neigh_obj == cur_obj and side_count < max_sideways:
-                candidates = []
-                for col in range(N):
-                    orig_row = state[col]
-                    for r in range(N):
-                        if r == orig_row:
-                            continue
-                        state[col] = r
-                        if objective(state) == neigh_obj:
-                            candidates.append(state.copy())
-                    state[col] = orig_row
-                if candidates:
-                    state = choice(candidates)
-                    side_count += 1
-                else:
+        state, iterations = climb(N, max_sideways, max_iterations)
+        if state is not None:
+            elapsed = perf_counter() - start_time
+            print("\nHill Climbing Results:")
+            print(f"Number of Queens : {N}")
+            print(f"Total time taken : {elapsed:.6f} seconds")
+            return state, board_from_state(state), elapsed
+    elapsed = perf_counter() - start_time
+    print("\nHill Climbing Results:")
+    print("No solution found")
+    return None, None, elapsed
+
+
+def climb_restarts(N, worker, restarts, seeds, stop_event, max_sideways, max_iterations):
+    """Worker side of hill_climb_parallel: runs its share of the restarts until one succeeds or the event is set."""
+    iterations = 0
+    for restart in restarts:
+        if stop_event.is_set():
+            break
+        rng = np.random.default_rng(seeds[restart])
+        state, its = climb(N, max_sideways, max_iterations, rng, stop_event.is_set)
+        iterations += its
+        if state is not None:
+            return state, worker, restart, its
+    return None, worker, None, iterations
+
+
+def hill_climb_parallel(
+    N: int,
+    workers: Optional[int] = None,
+    max_restarts: int = 50,
+    max_sideways: int = 100,
+    max_iterations: int = 10000,
+    seed: Optional[int] = None,
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], float]:
+    """
+    Portfolio of restarts over a process pool. Restart i gets its own seed
+    (SeedSequence(seed).spawn) and worker w runs restarts w, w + workers, ...
+    The first worker to find a solution sets a shared event; the others see it
+    between restarts (and every 100 iterations) and give up.
+    Same return values as hill_climb.
+    """
+    start_time = perf_counter()
+    workers = max(1, min(workers or os.cpu_count() or 1, max_restarts))
+    seeds = np.random.SeedSequence(seed).spawn(max_restarts)
+
+    winner = None
+    # "spawn" so workers never inherit the GUI's threads / Tk state through fork
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as manager:
+        stop_event = manager.Event()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    climb_restarts, N, w, range(w, max_restarts, workers), seeds,
+                    stop_event, max_sideways, max_iterations,
+                )
+                for w in range(workers)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                if result[0] is not None:
+                    winner = result
+                    stop_event.set()
                     break
-            else:
+
+    elapsed = perf_counter() - start_time
+    print("\nHill Climbing (parallel) Results:")
+    if winner is None:
+        print("No solution found")
+        return None, None, elapsed
+
+    state, worker, restart, iterations = winner
+    print(f"Number of Queens : {N}")
+    print(f"Winning worker   : {worker} of {workers}")
+    print(f"Restart index    : {restart}")
+    print(f"Iterations       : {iterations}")
+    print(f"Total time taken : {elapsed:.6f} seconds")
+    return state, board_from_state(state), elapsed
+
+
+def batch_line_counts(states: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """line_counts for every row of a (K, N) state matrix, each row offset into its own bins."""
+    K, N = states.shape
+    cols = np.arange(N)
+    offset = np.arange(K)[:, None]
+    rows_count = np.bincount((states + offset * N).ravel(), minlength=K * N).reshape(K, N)
+    width = 2 * N - 1
+    d1 = np.bincount((states - cols + (N - 1) + offset * width).ravel(), minlength=K * width).reshape(K, width)
+    d2 = np.bincount((states + cols + offset * width).ravel(), minlength=K * width).reshape(K, width)
+    return rows_count, d1, d2
+
+
+def hill_climb_batch(
+    N: int,
+    batch: int = 8,
+    max_restarts: int = 50,
+    max_sideways: int = 100,
+    max_iterations: int = 10000,
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], float]:
+    """
+    Same search as hill_climb, but `batch` restarts advance together as a
+    (batch, N) state matrix with per-row counters, so one NumPy step moves all
+    of them. A row that gets stuck is replaced by a fresh restart while the
+    max_restarts budget lasts; the first row to reach objective 0 is returned.
+    """
+    start_time = perf_counter()
+    comb2 = lambda x: (x * (x - 1)) // 2
+
+    K = max(1, min(batch, max_restarts))
+    states = np.random.randint(0, N, size=(K, N))
+    rows_count, d1, d2 = batch_line_counts(states)
+    obj = comb2(rows_count).sum(1) + comb2(d1).sum(1) + comb2(d2).sum(1)
+    side_count = np.zeros(K, dtype=int)
+    iterations = np.zeros(K, dtype=int)
+    active = np.ones(K, dtype=bool)
+    started = K
+
+    cols = np.arange(N)
+    k1 = np.arange(K)[:, None]
+
+    while active.any():
+        solved = np.flatnonzero(active & (obj == 0))
+        if solved.size:
+            state = states[solved[0]].copy()
+            elapsed = perf_counter() - start_time
+            print("\nBatched Hill Climbing Results:")
+            print(f"Number of Queens : {N}")
+            print(f"Restarts used    : {started} ({K} at a time)")
+            print(f"Total time taken : {elapsed:.6f} seconds")
+            return state, board_from_state(state), elapsed
+
+        # neighbor_costs for all rows at once: (K, N, N) -> (K, N * N)
+        leave = rows_count[k1, states] + d1[k1, states - cols + (N - 1)] + d2[k1, states + cols] - 3
+        costs = (
+            rows_count[:, None, :]
+            + sliding_window_view(d1, N, axis=1)[:, ::-1]
+            + sliding_window_view(d2, N, axis=1)
+            - leave[:, :, None]
+            + obj[:, None, None]
+        )
+        costs[k1, cols, states] = np.iinfo(costs.dtype).max
+        costs = costs.reshape(K, N * N)
+
+        best = costs.min(1)
+        improve = active & (best < obj)
+        sideways = active & (best == obj) & (side_count < max_sideways)
+        ties = costs == best[:, None]
+        pick = ties.argmax(1)    # steepest move: first best index, as in hill_climb
+        for k in np.flatnonzero(sideways):
+            pick[k] = choice(np.flatnonzero(ties[k]))
+
+        moving = np.flatnonzero(improve | sideways)
+        col, row = np.divmod(pick[moving], N)
+        old = states[moving, col]
+        rows_count[moving, old] -= 1
+        d1[moving, old - col + (N - 1)] -= 1
+        d2[moving, old + col] -= 1
+        rows_count[moving, row] += 1
+        d1[moving, row - col + (N - 1)] += 1
+        d2[moving, row + col] += 1
+        states[moving, col] = row
+        obj[moving] = best[moving]
+        side_count[improve] = 0
+        side_count[sideways] += 1
+        iterations[moving] += 1
+
+        # stuck or out of iterations -> fresh restart in that row, while the budget lasts
+        stuck = active & (~(improve | sideways) | ((iterations >= max_iterations) & (obj != 0)))
+        for k in np.flatnonzero(stuck):
+            if started >= max_restarts:
+                active[k] = False
+                continue
+            states[k] = random_state(N)
+            rows_count[k], d1[k], d2[k] = line_counts(states[k])
+            obj[k] = objective(states[k])
+            side_count[k] = 0
+            iterations[k] = 0
+            started += 1
+
+    elapsed = perf_counter() - start_time
+    print("\nBatched Hill Climbing Results:")
+    print("No solution found")
+    return None, None, elapsed
+
+
+def first_choice_climb(
+    N: int,
+    max_sideways: int = 100,
+    max_iterations: int = 10000,
+    max_tries: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+) -> Tuple[Optional[np.ndarray], int, int]:
+    """
+    One restart of first-choice hill climbing: moves are drawn at random and
+    the first improving one is taken, scored in O(1) from the counts.
+    Only queens that are attacked are drawn (moving the others can never
+    improve). After `max_tries` moves without an improvement (default N) a
+    zero-delta move seen on the way is taken as a sideways move, or the climb
+    gives up.
+    Returns (state, moves, evaluations); state is None if the climb got stuck.
+    """
+    rng = rng if rng is not None else random.Random(np.random.randint(2 ** 31))
+    max_tries = max_tries if max_tries is not None else N
+    state = random_state(N)
+    counts = line_counts(state)
+    cur_obj = objective(state)
+    cols = np.arange(N)
+    last = N - 1
+    randrange = rng.randrange
+
+    evaluations = 0
+    side_count = 0
+    for it in range(max_iterations):
+        if cur_obj == 0:
+            return state, it, evaluations
+
+        # one O(N) NumPy pass per move for the attacked queens, then scoring in plain Python
+        rows_count, d1, d2 = counts
+        leave = rows_count[state] + d1[state - cols + last] + d2[state + cols] - 3
+        attacked = np.flatnonzero(leave).tolist()
+        leave = leave.tolist()
+        rows_list, d1_list, d2_list, state_list = rows_count.tolist(), d1.tolist(), d2.tolist(), state.tolist()
+
+        move = sideways = None
+        for _ in range(max_tries):
+            col = attacked[randrange(len(attacked))]
+            old = state_list[col]
+            row = randrange(N - 1)
+            if row >= old:
+                row += 1
+            evaluations += 1
+            delta = rows_list[row] + d1_list[row - col + last] + d2_list[row + col] - leave[col]
+            if delta < 0:
+                move = (col, row)
                 break
+            if delta == 0 and sideways is None:
+                sideways = (col, row)
+
+        if move is not None:
+            side_count = 0
+        elif sideways is not None and side_count < max_sideways:
+            move, delta = sideways, 0
+            side_count += 1
+        else:
+            return None, it, evaluations
+
+        apply_move(state, counts, *move)
+        cur_obj += delta
+    return None, max_iterations, evaluations
+
+
+def first_choice_hill_climb(
+    N: int,
+    max_restarts: int = 50,
+    max_sideways: int = 100,
+    max_iterations: int = 10000,
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], float]:
+    """Same interface as hill_climb; prints the evaluations spent on the solution."""
+    start_time = perf_counter()
+
+    evaluations = 0
+    for restart in range(max_restarts):
+        state, moves, evals = first_choice_climb(N, max_sideways, max_iterations)
+        evaluations += evals
+        if state is not None:
+            elapsed = perf_counter() - start_time
+            print("\nFirst-Choice Hill Climbing Results:")
+            print(f"Number of Queens : {N}")
+            print(f"Restarts         : {restart + 1}")
+            print(f"Evaluations      : {evaluations}")
+            print(f"Total time taken : {elapsed:.6f} seconds")
+            return state, board_from_state(state), elapsed
     elapsed = perf_counter() - start_time
-    print("\nHill Climbing Results:")
+    print("\nFirst-Choice Hill Climbing Results:")
+    print("No solution found")
+    print(f"Evaluations      : {evaluations}")
+    return None, None, elapsed
+
+
+# Evaluations and time per solution: first-choice vs steepest ascent (climb)
+def benchmark_first_choice(n_values=(50, 100, 200, 500), runs=3):
+    print(f"{'N':>5} {'steepest evals':>15} {'steepest (s)':>13} {'first evals':>12} {'first (s)':>10}")
+    for N in n_values:
+        steep_evals = first_evals = 0
+        t0 = perf_counter()
+        for _ in range(runs):
+            state = None
+            while state is None:
+                state, its = climb(N)
+                steep_evals += its * N * (N - 1)
+        t_steep = (perf_counter() - t0) / runs
+
+        t0 = perf_counter()
+        for _ in range(runs):
+            state = None
+            while state is None:
+                state, moves, evals = first_choice_climb(N)
+                first_evals += evals
+        t_first = (perf_counter() - t0) / runs
+
+        print(f"{N:>5} {steep_evals // runs:>15} {t_steep:>13.4f} {first_evals // runs:>12} {t_first:>10.4f}")
+
+# ---------------------------------------------------------------
+# Permutation neighbourhood: one queen per row and per column, so only the
+# diagonals can conflict; a move swaps the rows of two columns.
+# ---------------------------------------------------------------
+def random_permutation(N: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    if rng is not None:
+        return rng.permutation(N)
+    return np.random.permutation(N)
+
+
+def swap_deltas(state: np.ndarray, d1: np.ndarray, d2: np.ndarray, i: int) -> np.ndarray:
+    """
+    Objective change of swapping the rows of column i and every column j, from
+    the diagonal counts alone. Queens i (row a) and j (row b) leave their
+    diagonals and land on (b, i) and (a, j); those four new diagonals never
+    coincide with the old ones, so only "i and j shared a diagonal" (before or
+    after) needs a correction. Entry i is the dtype's max.
+    """
+    N = state.size
+    last = N - 1
+    cols = np.arange(N)
+    a = state[i]
+
+    old1 = state - cols + last    # d1 line of each queen j
+    old2 = state + cols
+    a1, a2 = a - i + last, a + i
+    leave1 = np.where(old1 == a1, 2 * d1[a1] - 3, d1[a1] + d1[old1] - 2)
+    leave2 = np.where(old2 == a2, 2 * d2[a2] - 3, d2[a2] + d2[old2] - 2)
+
+    new_i1, new_j1 = state - i + last, a - cols + last
+    new_i2, new_j2 = state + i, a + cols
+    join1 = np.where(new_i1 == new_j1, 2 * d1[new_i1] + 1, d1[new_i1] + d1[new_j1])
+    join2 = np.where(new_i2 == new_j2, 2 * d2[new_i2] + 1, d2[new_i2] + d2[new_j2])
+
+    deltas = join1 + join2 - leave1 - leave2
+    deltas[i] = np.iinfo(deltas.dtype).max
+    return deltas
+
+
+def apply_swap(state: np.ndarray, d1: np.ndarray, d2: np.ndarray, i: int, j: int) -> None:
+    N = state.size
+    a, b = state[i], state[j]
+    d1[a - i + N - 1] -= 1
+    d2[a + i] -= 1
+    d1[b - j + N - 1] -= 1
+    d2[b + j] -= 1
+    d1[b - i + N - 1] += 1
+    d2[b + i] += 1
+    d1[a - j + N - 1] += 1
+    d2[a + j] += 1
+    state[i], state[j] = b, a
+
+
+def perm_climb(
+    N: int,
+    max_sideways: int = 100,
+    max_iterations: int = 10000,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[Optional[np.ndarray], int]:
+    """
+    One restart of swap hill climbing from a random permutation.
+    Conflicted columns are tried in random order; the first one with an
+    improving swap takes its best swap. If none improves, a zero-delta swap of
+    the first column that has one is taken as a sideways move.
+    Returns (state, swaps); state is None if the climb got stuck.
+    """
+    if rng is None:    # follow the global NumPy seed, like random_state
+        rng = np.random.default_rng(np.random.randint(2 ** 31))
+    state = random_permutation(N, rng)
+    _, d1, d2 = line_counts(state)
+    cur_obj = objective(state)
+    cols = np.arange(N)
+    side_count = 0
+
+    for it in range(max_iterations):
+        if cur_obj == 0:
+            return state, it
+
+        conflicted = np.flatnonzero(d1[state - cols + (N - 1)] + d2[state + cols] > 2)
+        sideways = None
+        for i in rng.permutation(conflicted).tolist():
+            deltas = swap_deltas(state, d1, d2, i)
+            best = int(deltas.min())
+            if best < 0:
+                apply_swap(state, d1, d2, i, int(deltas.argmin()))
+                cur_obj += best
+                side_count = 0
+                break
+            if best == 0 and sideways is None:
+                sideways = (i, np.flatnonzero(deltas == 0))
+        else:
+            if sideways is None or side_count >= max_sideways:
+                return None, it
+            i, ties = sideways
+            apply_swap(state, d1, d2, i, int(rng.choice(ties)))
+            side_count += 1
+    return None, max_iterations
+
+
+def perm_hill_climb(
+    N: int,
+    max_restarts: int = 50,
+    max_sideways: int = 100,
+    max_iterations: int = 10000,
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], float]:
+    """Same interface as hill_climb, over permutations with swap moves."""
+    start_time = perf_counter()
+
+    swaps = 0
+    for restart in range(max_restarts):
+        state, its = perm_climb(N, max_sideways, max_iterations)
+        swaps += its
+        if state is not None:
+            elapsed = perf_counter() - start_time
+            print("\nPermutation Hill Climbing Results:")
+            print(f"Number of Queens : {N}")
+            print(f"Restarts / swaps : {restart + 1} / {swaps}")
+            print(f"Total time taken : {elapsed:.6f} seconds")
+            return state, board_from_state(state), elapsed
+    elapsed = perf_counter() - start_time
+    print("\nPermutation Hill Climbing Results:")
     print("No solution found")
-    return None, None, elapsed
\ No newline at end of file
+    return None, None, elapsed
@@ -1,4 +1,5 @@
 # report_helper.py
+import os
 import threading
 import time
 import tkinter as tk
@@ -9,6 +10,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import globals as g
 import constants
 import algo_demo
+from solution_set import SolutionSet
 
 
 
@@ -18,13 +20,31 @@ results_lock = threading.Lock()
 # run backtracking algo once ===> each solution with its time
 def _run_backtracking_once(n: int):
     start_time = time.perf_counter()
-    solutions, solution_times = algo_demo.backtracking(
-        n, record_times=True, start_time=start_time
-    )
+    results = g.algorithm_results[constants.ALGO_BACKTRACKING]
+
+    cpus = os.cpu_count() or 1
+    if n >= constants.BACKTRACK_PARALLEL_MIN_N and cpus >= constants.BACKTRACK_PARALLEL_MIN_CPUS:
+        solutions, solution_times = algo_demo.backtracking_parallel(
+            n,
+            start_time=start_time,
+            workers=constants.BACKTRACK_WORKERS,
+            should_stop=lambda: g.cancel_flag,
+        )
+        # workers finish out of order -> sort by discovery time for the plot
+        found = sorted(zip(solution_times, solutions), key=lambda pair: pair[0])
+        with results_lock:
+            results["solutions"].extend(sol for _, sol in found)
+            results["times"].extend(sol_time for sol_time, _ in found)
+        return
 
-    with results_lock:
-        g.algorithm_results[constants.ALGO_BACKTRACKING]["solutions"].extend(solutions)
-        g.algorithm_results[constants.ALGO_BACKTRACKING]["times"].extend(solution_times)
+    # solutions are streamed, so a cancel stops the enumeration right away.
+    # The report times the search itself, so it never reads the solution store.
+    for sol, sol_time in algo_demo.iter_backtracking(n, start_time=start_time, use_store=False):
+        if g.cancel_flag:
+            break
+        with results_lock:
+            results["solutions"].append(sol)
+            results["times"].append(sol_time)
 
 
 def _run_meta_single(strategy: str, n: int):
@@ -32,34 +52,45 @@ def _run_meta_single(strategy: str, n: int):
     start_time = time.perf_counter()
 
     if strategy == constants.ALGO_BEST_FIRST:
-        sol = algo_demo.best_first(n)
+        sol = algo_demo.best_first(
+            n,
+            visited=constants.BEST_FIRST_VISITED,
+            max_frontier=constants.BEST_FIRST_MAX_FRONTIER,
+        )
     elif strategy == constants.ALGO_HILL_CLIMB:
-        sol = algo_demo.hill_climbing(n)
+        batched = constants.HILL_CLIMB_BATCH_MIN_N <= n <= constants.HILL_CLIMB_BATCH_MAX_N
+        sol = algo_demo.hill_climbing(n, batch=constants.HILL_CLIMB_BATCH if batched else None)
     elif strategy == constants.ALGO_CULTURAL:
         sol = algo_demo.cultural(n, start_time)
+    elif strategy == constants.ALGO_CONSTRUCTIVE:
+        sol = algo_demo.constructive(n)
+    elif strategy == constants.ALGO_MIN_CONFLICTS:
+        sol = algo_demo.min_conflicts(n)
+    elif strategy == constants.ALGO_ANNEALING:
+        sol = algo_demo.simulated_annealing(n)
+    elif strategy == constants.ALGO_TABU:
+        sol = algo_demo.tabu_search(n)
     else:
-        sol = []
+        sol = SolutionSet(n)
 
     end_time = time.perf_counter()
     dt = end_time - start_time
 
-    print(f"\n{strategy} single run results: Number of Queens : {n}, Total time taken : {dt:.6f} seconds, solution ====> {sol}")
+    print(f"\n{strategy} single run results: Number of Queens : {n}, Total time taken : {dt:.6f} seconds, solution ====> {sol.tolist()}")
 
-    if sol:
-        with results_lock:
-            g.algorithm_results[strategy]["solutions"].append(sol)
-            g.algorithm_results[strategy]["times"].append(dt)
-    else:
-        with results_lock:
-            g.algorithm_results[strategy]["solutions"].append(None)
-            g.algorithm_results[strategy]["times"].append(dt)
+    # every run is timed; only successful runs add a solution
+    with results_lock:
+        g.algorithm_results[strategy]["solutions"].extend(sol)
+        g.algorithm_results[strategy]["times"].append(dt)
 
 
 def start_report(root):
     """
     Called from UI.
-    - Backtracking: 1 thread (multiple solutions with their times)
-    - Best-first, Hill-climb, Cultural: n threads each (each run = 1 thread)
+    - Backtracking: 1 thread (multiple solutions with their times),
+      which fans out to a process pool for N >= BACKTRACK_PARALLEL_MIN_N
+      on machines with at least BACKTRACK_PARALLEL_MIN_CPUS CPUs
+    - Meta-heuristics / Constructive / Min-conflicts: n threads each (each run = 1 thread)
     - All threads start in parallel, and we join them in a watcher thread.
     """
     if getattr(g, "is_reporting", False):
@@ -84,6 +115,10 @@ def start_report(root):
         constants.ALGO_BEST_FIRST,
         constants.ALGO_HILL_CLIMB,
         constants.ALGO_CULTURAL,
+        constants.ALGO_CONSTRUCTIVE,
+        constants.ALGO_MIN_CONFLICTS,
+        constants.ALGO_ANNEALING,
+        constants.ALGO_TABU,
     ]
 
     threads = []
@@ -158,6 +193,10 @@ def show_report_window(root, n: int):
         constants.ALGO_BEST_FIRST,
         constants.ALGO_HILL_CLIMB,
         constants.ALGO_CULTURAL,
+        constants.ALGO_CONSTRUCTIVE,
+        constants.ALGO_MIN_CONFLICTS,
+        constants.ALGO_ANNEALING,
+        constants.ALGO_TABU,
     ]
 
     # Same colors as your simple script
@@ -166,6 +205,10 @@ def show_report_window(root, n: int):
         constants.ALGO_BEST_FIRST:   'b',  # Blue
         constants.ALGO_HILL_CLIMB:   'y',  # Yellow
         constants.ALGO_CULTURAL:     'm',  # Magenta
+        constants.ALGO_CONSTRUCTIVE: 'g',  # Green
+        constants.ALGO_MIN_CONFLICTS: 'c',  # Cyan
+        constants.ALGO_ANNEALING: 'k',  # Black
+        constants.ALGO_TABU: 'tab:brown',  # Brown
     }
 
     for strategy in strategies:
@@ -0,0 +1,161 @@
+import math
+import numpy as np
+import random
+from time import perf_counter
+from typing import Optional, Tuple
+
+from hillclimb import line_counts, objective, random_state
+
+
+# temperature after k steps since the last (re)heat, starting from t_start
+# (linear reaches zero after `horizon` steps, the stagnation window)
+SCHEDULES = {
+    "geometric": lambda t_start, k, alpha, horizon: t_start * alpha ** k,
+    "linear":    lambda t_start, k, alpha, horizon: t_start * max(0.0, 1 - k / horizon),
+    "log":       lambda t_start, k, alpha, horizon: t_start / math.log(k + 2),
+}
+MIN_TEMPERATURE = 1e-3
+
+
+def simulated_annealing(
+    N: int,
+    max_steps: Optional[int] = None,
+    t0: float = 2.0,
+    schedule: str = "geometric",
+    alpha: float = 0.999,
+    stagnation: Optional[int] = None,
+    reheat: float = 0.5,
+    seed: Optional[int] = None,
+) -> Tuple[Optional[np.ndarray], int, float]:
+    """
+    Simulated annealing over the hill-climbing state (one queen per column).
+    Each step proposes moving a random attacked queen to a random other row;
+    its delta comes from the row / diagonal counters in O(1), so objective()
+    is only called once, at the start. Attacked queens are drawn from a list
+    of conflicted columns kept up to date from per-line queen sets (stale
+    entries dropped when drawn), so a step does not depend on how few
+    conflicts are left.
+    Worse moves are accepted with probability exp(-delta / T), T following
+    `schedule` (see SCHEDULES). When the best objective has not improved for
+    `stagnation` steps the schedule restarts from reheat * t0.
+    max_steps defaults to 1000 * N (at least 200000), stagnation to 20 * N
+    (at least 2000).
+    Returns (state, steps, elapsed); state is None if max_steps ran out.
+    """
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown cooling schedule {schedule!r}, expected one of {sorted(SCHEDULES)}.")
+
+    start_time = perf_counter()
+    rng = random.Random(seed)
+    temperature_at = SCHEDULES[schedule]
+
+    state_arr = random_state(N, np.random.default_rng(seed))
+    cur_obj = objective(state_arr)
+    rows_count, d1, d2 = (c.tolist() for c in line_counts(state_arr))
+    state = state_arr.tolist()
+    last = N - 1
+    if max_steps is None:
+        max_steps = max(200000, 1000 * N)
+    if stagnation is None:
+        stagnation = max(2000, 20 * N)
+
+    def attacked(col):
+        row = state[col]
+        return rows_count[row] + d1[row - col + last] + d2[row + col] > 3
+
+    # queens on each row / diagonal, so the queens a move lands next to are
+    # found without scanning the board
+    row_members = [set() for _ in range(N)]
+    d1_members = [set() for _ in range(2 * N - 1)]
+    d2_members = [set() for _ in range(2 * N - 1)]
+    for col, row in enumerate(state):
+        row_members[row].add(col)
+        d1_members[row - col + last].add(col)
+        d2_members[row + col].add(col)
+
+    # every attacked queen is listed: a taken move adds the moved queen and the
+    # queens on its new lines; entries that are no longer attacked are dropped
+    # when drawn
+    pending = [col for col in range(N) if attacked(col)]
+    listed = [False] * N
+    for col in pending:
+        listed[col] = True
+
+    best_obj = cur_obj
+    since_best = 0
+    t_start, k = t0, 0
+    reheats = 0
+    steps = 0
+
+    while cur_obj and steps < max_steps:
+        steps += 1
+        k += 1
+        temperature = max(temperature_at(t_start, k, alpha, stagnation), MIN_TEMPERATURE)
+
+        # an attacked queen: moving a conflict-free one can only make things worse
+        while True:
+            i = rng.randrange(len(pending))
+            col = pending[i]
+            if attacked(col):
+                break
+            pending[i] = pending[-1]
+            pending.pop()
+            listed[col] = False
+        old = state[col]
+        row = rng.randrange(N - 1)
+        if row >= old:
+            row += 1    # any row but the current one
+
+        delta = (rows_count[row] + d1[row - col + last] + d2[row + col]) - (
+            rows_count[old] + d1[old - col + last] + d2[old + col] - 3
+        )
+        if delta > 0 and rng.random() >= math.exp(-delta / temperature):
+            since_best += 1
+        else:
+            rows_count[old] -= 1
+            d1[old - col + last] -= 1
+            d2[old + col] -= 1
+            rows_count[row] += 1
+            d1[row - col + last] += 1
+            d2[row + col] += 1
+            state[col] = row
+            cur_obj += delta
+
+            for members, old_line, new_line in (
+                (row_members, old, row),
+                (d1_members, old - col + last, row - col + last),
+                (d2_members, old + col, row + col),
+            ):
+                members[old_line].discard(col)
+                line = members[new_line]
+                line.add(col)
+                if len(line) > 1:
+                    for other in line:
+                        if not listed[other]:
+                            pending.append(other)
+                            listed[other] = True
+
+            if cur_obj < best_obj:
+                best_obj = cur_obj
+                since_best = 0
+            else:
+                since_best += 1
+
+        if since_best >= stagnation:
+            t_start, k = reheat * t0, 0
+            best_obj = cur_obj
+            since_best = 0
+            reheats += 1
+
+    elapsed = perf_counter() - start_time
+    print("\nSimulated Annealing Results:")
+    print(f"Number of Queens : {N}")
+    if cur_obj:
+        print("No solution found")
+    print(f"Schedule         : {schedule} (reheated {reheats} times)")
+    print(f"Steps            : {steps}")
+    print(f"Total time taken : {elapsed:.6f} seconds")
+
+    if cur_obj:
+        return None, steps, elapsed
+    return np.array(state), steps, elapsed
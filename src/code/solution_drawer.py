@@ -8,7 +8,8 @@ def draw_solution(sol):
     cell = 50
     margin = 20
 
-    for c, r in enumerate(sol):
+    # rows come from a SolutionSet as small unsigned ints -> plain ints first
+    for c, r in enumerate(map(int, sol)):
         x = margin + (c * cell) + cell/2
         y = margin + ((r-1) * cell) + cell/2
         g.canvas.create_text(x, y, text=constants.QUEEN_LOGO,
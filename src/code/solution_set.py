@@ -0,0 +1,125 @@
+# solution_set.py
+#
+# Compact container for many solutions of one N.
+# All solutions live in one contiguous (count, n) NumPy buffer of small
+# unsigned ints (1 byte per queen up to N = 255, 2 bytes up to 65535),
+# instead of one Python list of Python ints per solution.
+# Values are 1-indexed, like the lists the strategies used to return.
+import numpy as np
+
+
+def dtype_for(n):
+    if n <= 0xFF:
+        return np.uint8
+    if n <= 0xFFFF:
+        return np.uint16
+    return np.uint32
+
+
+class SolutionSet:
+    """
+    Behaves like a list of solutions:
+      len(s), iteration, s[i], s[a:b], append, extend, clear.
+    s[i] and iteration give zero-copy NumPy row views; s[a:b] is a SolutionSet
+    sharing the same buffer. Rows are small unsigned ints, so convert with int()
+    / tolist() before doing arithmetic that can overflow them.
+    """
+
+    def __init__(self, n=None, solutions=None):
+        self.n = n              # taken from the first solution when None
+        self._given_n = n
+        self._data = None       # (capacity, n) buffer, rows [0, _len) are used
+        self._len = 0
+        if solutions is not None:
+            self.extend(solutions)
+
+    # ---------------------------------------------------------------
+    # Building
+    # ---------------------------------------------------------------
+    def _reserve(self, extra):
+        need = self._len + extra
+        if self._data is None:
+            self._data = np.empty((max(need, 16), self.n), dtype=dtype_for(self.n))
+        elif need > len(self._data):
+            # grow by doubling; row views handed out earlier keep the old buffer
+            grown = np.empty((max(need, 2 * len(self._data)), self.n), dtype=self._data.dtype)
+            grown[:self._len] = self._data[:self._len]
+            self._data = grown
+
+    def append(self, solution):
+        if self.n is None:
+            self.n = len(solution)
+        self._reserve(1)
+        self._data[self._len] = solution
+        self._len += 1
+
+    def extend(self, solutions):
+        if isinstance(solutions, SolutionSet):
+            rows = solutions.array
+        elif isinstance(solutions, (list, tuple, np.ndarray)):
+            rows = np.asarray(solutions)
+        else:
+            for solution in solutions:    # generators: no intermediate list
+                self.append(solution)
+            return
+
+        if len(rows) == 0:
+            return
+        if self.n is None:
+            self.n = rows.shape[1]
+        self._reserve(len(rows))
+        self._data[self._len:self._len + len(rows)] = rows
+        self._len += len(rows)
+
+    def clear(self):
+        self._data = None
+        self._len = 0
+        self.n = self._given_n    # a shared set (g.algorithm_results) can take a new N
+
+    # ---------------------------------------------------------------
+    # Reading
+    # ---------------------------------------------------------------
+    @property
+    def array(self):
+        """(count, n) view of the stored solutions."""
+        if self._data is None:
+            return np.empty((0, self.n or 0), dtype=dtype_for(self.n or 0))
+        return self._data[:self._len]
+
+    @property
+    def nbytes(self):
+        return self.array.nbytes
+
+    def tolist(self):
+        return self.array.tolist()
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        data = self._data
+        for i in range(self._len):
+            yield data[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = SolutionSet(self.n)
+            view._data = self.array[index]
+            view._len = len(view._data)
+            return view
+
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("solution index out of range")
+        return self._data[index]
+
+    def __eq__(self, other):
+        if isinstance(other, SolutionSet):
+            return self.tolist() == other.tolist()
+        if isinstance(other, list):
+            return self.tolist() == [list(solution) for solution in other]
+        return NotImplemented
+
+    def __repr__(self):
+        return f"SolutionSet(n={self.n}, count={self._len})"
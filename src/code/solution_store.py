@@ -0,0 +1,127 @@
+# solution_store.py
+#
+# On-disk cache of all backtracking solutions for a given N.
+# One binary file per N:
+#   header  -> magic, version, bytes per queen, n, count
+#   records -> count fixed-width records of n 0-indexed columns
+#              (1 byte per queen up to N = 256, 2 bytes above)
+# Files are opened with mmap, so count / i-th / random solution never load the
+# whole set.
+import mmap
+import os
+import random
+import struct
+import threading
+
+import constants
+from BackTrack import iter_solutions
+
+MAGIC = b"NQSS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQ")    # magic, version, width, n, count
+
+
+class SolutionStore:
+    def __init__(self, directory=constants.SOLUTION_STORE_DIR):
+        self.directory = directory
+        self._maps = {}    # n -> (mmap, record format, count)
+        self._lock = threading.Lock()
+
+    def path(self, n):
+        return os.path.join(self.directory, f"n{n}.bin")
+
+    def has(self, n):
+        return os.path.exists(self.path(n))
+
+    # ---------------------------------------------------------------
+    # Reading
+    # ---------------------------------------------------------------
+    def _open(self, n):
+        with self._lock:
+            if n in self._maps:
+                return self._maps[n]
+
+            with open(self.path(n), "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, version, width, stored_n, count = HEADER.unpack_from(mm, 0)
+            if magic != MAGIC or version != VERSION or stored_n != n:
+                mm.close()
+                raise ValueError(f"{self.path(n)} is not a solution file for N = {n}.")
+
+            record = struct.Struct(f"<{n}{'B' if width == 1 else 'H'}")
+            self._maps[n] = (mm, record, count)
+            return self._maps[n]
+
+    def _close(self, n):
+        with self._lock:
+            entry = self._maps.pop(n, None)
+        if entry is not None:
+            entry[0].close()
+
+    def count(self, n):
+        self.ensure(n)
+        return self._open(n)[2]
+
+    def get(self, n, i):
+        """i-th solution (0-based), 1-indexed like backtrackingAlgo."""
+        self.ensure(n)
+        mm, record, count = self._open(n)
+        if not 0 <= i < count:
+            raise IndexError(f"Solution {i} out of range for N = {n} ({count} solutions).")
+        return [col + 1 for col in record.unpack_from(mm, HEADER.size + i * record.size)]
+
+    def random(self, n):
+        count = self.count(n)
+        if count == 0:
+            return None
+        return self.get(n, random.randrange(count))
+
+    def iter_solutions(self, n):
+        """
+        Streams the stored solutions; on a miss it enumerates them with
+        BackTrack.iter_solutions and saves the file once the stream is complete.
+        """
+        if not self.has(n):
+            yield from self._compute(n)
+            return
+
+        mm, record, count = self._open(n)
+        for i in range(count):
+            yield [col + 1 for col in record.unpack_from(mm, HEADER.size + i * record.size)]
+
+    # ---------------------------------------------------------------
+    # Writing
+    # ---------------------------------------------------------------
+    def ensure(self, n):
+        if not self.has(n):
+            for _ in self._compute(n):
+                pass
+
+    def _compute(self, n):
+        os.makedirs(self.directory, exist_ok=True)
+        width = 1 if n <= 256 else 2
+        record = struct.Struct(f"<{n}{'B' if width == 1 else 'H'}")
+
+        # written to a temp file and renamed at the end, so a stream that is
+        # stopped early (cancel) never leaves a partial store behind
+        tmp = self.path(n) + f".{os.getpid()}.{threading.get_ident()}.tmp"
+        count = 0
+        try:
+            with open(tmp, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, width, n, 0))
+                for sol in iter_solutions(n):
+                    f.write(record.pack(*[col - 1 for col in sol]))
+                    count += 1
+                    yield sol
+                f.seek(0)
+                f.write(HEADER.pack(MAGIC, VERSION, width, n, count))
+
+            self._close(n)
+            os.replace(tmp, self.path(n))
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+
+default_store = SolutionStore()
@@ -0,0 +1,120 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from time import perf_counter
+from typing import Optional, Tuple
+
+from hillclimb import apply_move, line_counts, objective, random_state
+
+
+class TabuList:
+    """
+    Fixed-size ring buffer of recent (col, row) moves, plus a hash of the same
+    keys (col * N + row -> occurrences) so membership is O(1).
+    """
+
+    def __init__(self, N: int, tenure: int):
+        self.N = N
+        self.ring = [-1] * tenure
+        self.head = 0
+        self.keys = {}
+
+    def push(self, col: int, row: int) -> None:
+        old = self.ring[self.head]
+        if old >= 0:
+            if self.keys[old] == 1:
+                del self.keys[old]
+            else:
+                self.keys[old] -= 1
+        key = col * self.N + row
+        self.ring[self.head] = key
+        self.keys[key] = self.keys.get(key, 0) + 1
+        self.head = (self.head + 1) % len(self.ring)
+
+    def __contains__(self, move: Tuple[int, int]) -> bool:
+        return move[0] * self.N + move[1] in self.keys
+
+    def __iter__(self):
+        return (divmod(key, self.N) for key in self.keys)
+
+
+def tabu_search(
+    N: int,
+    max_iterations: int = 100000,
+    tenure: Optional[int] = None,
+    max_columns: int = 64,
+    seed: Optional[int] = None,
+) -> Tuple[Optional[np.ndarray], int, int, float]:
+    """
+    Tabu search over the hill-climbing state (one queen per column).
+    Every iteration takes the best move of a conflicted queen, even when it is
+    worse than staying put, and forbids putting that queen back on the row it
+    left for the next `tenure` moves. A tabu move is still allowed when it
+    beats the best objective seen so far (aspiration).
+    Moves are scored from the row / diagonal counters, and only for conflicted
+    columns (a random sample of `max_columns` of them on large boards).
+    Returns (state, iterations, evaluations, elapsed); state is None if
+    max_iterations ran out.
+    """
+    start_time = perf_counter()
+    rng = np.random.default_rng(seed)
+    if tenure is None:
+        tenure = max(3, min(N // 4, 20))
+
+    state = random_state(N, rng)
+    counts = line_counts(state)
+    rows_count, d1, d2 = counts
+    cur_obj = best_obj = objective(state)
+    tabu = TabuList(N, tenure)
+    blocked = np.iinfo(np.int64).max
+
+    cols = np.arange(N)
+    evaluations = 0
+    iterations = 0
+    while cur_obj and iterations < max_iterations:
+        iterations += 1
+
+        attackers = rows_count[state] + d1[state - cols + (N - 1)] + d2[state + cols] - 3
+        candidates = np.flatnonzero(attackers)
+        if candidates.size > max_columns:
+            candidates = rng.choice(candidates, max_columns, replace=False)
+
+        # neighbor_costs restricted to the candidate columns
+        costs = (
+            rows_count[None, :]
+            + sliding_window_view(d1, N)[::-1][candidates]
+            + sliding_window_view(d2, N)[candidates]
+            - attackers[candidates, None]
+            + cur_obj
+        )
+        costs[np.arange(candidates.size), state[candidates]] = blocked
+        evaluations += candidates.size * (N - 1)
+
+        position = {col: i for i, col in enumerate(candidates.tolist())}
+        for col, row in tabu:
+            i = position.get(col)
+            if i is not None and costs[i, row] >= best_obj:    # aspiration otherwise
+                costs[i, row] = blocked
+
+        ties = np.flatnonzero(costs == costs.min())
+        i, row = divmod(int(rng.choice(ties)), N)
+        col = int(candidates[i])
+
+        move_obj = int(costs[i, row])
+        tabu.push(col, int(state[col]))
+        apply_move(state, counts, col, row)
+        # every move was tabu -> the pick carries no score, rescore the board
+        cur_obj = move_obj if move_obj != blocked else objective(state)
+        best_obj = min(best_obj, cur_obj)
+
+    elapsed = perf_counter() - start_time
+    print("\nTabu Search Results:")
+    print(f"Number of Queens : {N}")
+    if cur_obj:
+        print("No solution found")
+    print(f"Iterations       : {iterations}")
+    print(f"Evaluations      : {evaluations}")
+    print(f"Total time taken : {elapsed:.6f} seconds")
+
+    if cur_obj:
+        return None, iterations, evaluations, elapsed
+    return state, iterations, evaluations, elapsed
@@ -0,0 +1,116 @@
+# visited_set.py
+#
+# Visited-state sets for BestFirst, one class per backend:
+#   "tuple"   -> exact, the board as a tuple (what BestFirst used to store)
+#   "zobrist" -> one 64-bit Zobrist hash per board; a child's key is the
+#                parent's key with two XORs, so probing a child is O(1)
+#                (two different boards share a key with probability ~2^-64)
+#   "bloom"   -> Bloom filter over the Zobrist keys: fixed memory (128 KiB by
+#                default, ~1% false positives at 100k boards), but a false
+#                positive makes the search skip a board it never saw
+# All of them expose key(board), child_key(key, col, old_row, new_row),
+# add(key), `key in visited`, len() and nbytes.
+import random
+import sys
+
+
+class TupleVisited:
+    def __init__(self, n):
+        self.keys = set()
+        self.key_bytes = sys.getsizeof(tuple(range(n)))    # every key has the same size
+
+    def key(self, board):
+        return tuple(board)
+
+    def child_key(self, key, col, old_row, new_row):
+        return key[:col] + (new_row,) + key[col + 1:]
+
+    def add(self, key):
+        self.keys.add(key)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def nbytes(self):
+        return sys.getsizeof(self.keys) + len(self.keys) * self.key_bytes
+
+
+class ZobristVisited:
+    def __init__(self, n, seed=0):
+        rng = random.Random(seed)
+        # table[col][row]: random 64-bit word for "queen of col on row"
+        self.table = [[rng.getrandbits(64) for _ in range(n)] for _ in range(n)]
+        self.keys = set()
+        self.key_bytes = 0
+
+    def key(self, board):
+        h = 0
+        for col, row in enumerate(board):
+            h ^= self.table[col][row]
+        return h
+
+    def child_key(self, key, col, old_row, new_row):
+        column = self.table[col]
+        return key ^ column[old_row] ^ column[new_row]
+
+    def add(self, key):
+        if key not in self.keys:
+            self.keys.add(key)
+            self.key_bytes += sys.getsizeof(key)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def nbytes(self):
+        return sys.getsizeof(self.keys) + self.key_bytes
+
+
+class BloomVisited(ZobristVisited):
+    def __init__(self, n, seed=0, bits=1 << 20, hashes=4):
+        super().__init__(n, seed)
+        self.bits = bits
+        self.hashes = hashes
+        self.filter = bytearray(bits // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # double hashing on the two halves of the 64-bit key
+        h1 = key & 0xFFFFFFFF
+        h2 = (key >> 32) | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.filter[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.filter[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self):
+        return sys.getsizeof(self.filter)
+
+
+VISITED_BACKENDS = {
+    "tuple": TupleVisited,
+    "zobrist": ZobristVisited,
+    "bloom": BloomVisited,
+}
+
+
+def make_visited(backend, n):
+    if backend not in VISITED_BACKENDS:
+        raise ValueError(f"Unknown visited-set backend {backend!r}, expected one of {sorted(VISITED_BACKENDS)}.")
+    return VISITED_BACKENDS[backend](n)
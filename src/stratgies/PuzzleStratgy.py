@@ -10,6 +10,12 @@ class PuzzleStratgy(ABC):
     def generateReport(self, N = 4):
         pass
 
+    # yields solutions one by one; strategies that can stream should override it
+    def iter_solutions(self, N = 4):
+        solutions = self.solve(N)
+        if solutions:
+            yield from solutions
+
     @staticmethod
     def isSafe(self, board, row, col, N):
         for i in range(col):